@@ -1,18 +1,9 @@
-import questionary
-from questionary import Separator
 import os
 import sys
-import json
 import subprocess
 from os import name
 
-from .config_wizard import run_setup_wizard
-from .install_wizard import run_install_wizard
-from .installer import install_version, delete_version
-from .profile_applier import apply_profile
-from .launcher import run_launcher
-from .skin_manager import apply_skin, rename_skin, delete_skin
-from .profile_editor import edit_existing_profile
+from .config_store import get_value
 
 
 def clearscreen():
@@ -22,20 +13,10 @@ def clearscreen():
         _ = os.system("clear")
 
 
-def load_launcher_config():
-    config_path = os.path.abspath("launcher_config.json")
-    if not os.path.exists(config_path):
-        return {}
-
-    try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"Failed to read launcher_config.json: {e}")
-        return {}
-
-
 def skin_related_menu():
+    import questionary
+    from questionary import Separator
+
     while True:
         action = questionary.select(
             "Skin-related options:",
@@ -43,26 +24,37 @@ def skin_related_menu():
                 "Create new skin",
                 "Rename existing skin",
                 "Delete existing skin",
+                "Watch min_skin folder",
                 Separator(" "),
                 "Back"
             ]
         ).ask()
 
         if action == "Create new skin":
+            from .skin_manager import apply_skin
             apply_skin()
 
         elif action == "Rename existing skin":
+            from .skin_manager import rename_skin
             rename_skin()
 
         elif action == "Delete existing skin":
+            from .skin_manager import delete_skin
             delete_skin()
 
+        elif action == "Watch min_skin folder":
+            from .skin_watcher import watch_skins
+            watch_skins()
+
         elif action == "Back":
             clearscreen()
             break
 
 
 def profile_related_menu():
+    import questionary
+    from questionary import Separator
+
     while True:
         action = questionary.select(
             "Minecraft profiles related options:",
@@ -76,11 +68,14 @@ def profile_related_menu():
         ).ask()
 
         if action == "Create new profile":
+            from .config_wizard import run_setup_wizard
+            from .profile_applier import apply_profile
             config = run_setup_wizard()
             profile_path = apply_profile(config)
             print(f"\nProfile successfully created at: {profile_path}")
 
         elif action == "Edit existing profile":
+            from .profile_editor import edit_existing_profile
             edit_existing_profile()
 
         elif action == "Delete existing profile":
@@ -91,6 +86,9 @@ def profile_related_menu():
             break
 
 def delete_existing_profile():
+    import questionary
+    from questionary import Separator
+
     config_dir = os.path.abspath("min_configs")
 
     if not os.path.exists(config_dir):
@@ -129,6 +127,9 @@ def delete_existing_profile():
 
 
 def directories_related_menu():
+    import questionary
+    from questionary import Separator
+
     while True:
         action = questionary.select(
             "Directory-related options:",
@@ -152,8 +153,7 @@ def directories_related_menu():
 
 
 def open_minecraft_directory():
-    config = load_launcher_config()
-    mc_path = config.get("minecraft_dir")
+    mc_path = get_value("minecraft_dir")
 
     if mc_path and os.path.exists(mc_path):
         print(f"\nOpening Minecraft directory from config: {mc_path}")
@@ -185,18 +185,26 @@ def open_directory(path: str, label: str):
 
 
 def installations_related_menu():
+    import questionary
+    from questionary import Separator
+
     while True:
         action = questionary.select(
             "Installations-related options:",
             choices=[
                 "Install new MC version",
+                "Install multiple MC versions",
                 "Delete existing MC version",
+                "Clean up unused libraries/assets",
+                "Deduplicate into shared store",
                 Separator(" "),
                 "Back"
             ]
         ).ask()
 
         if action == "Install new MC version":
+            from .install_wizard import run_install_wizard
+            from .installer import install_version
             install_info = run_install_wizard()
             print("install_info: ",install_info)
             if install_info != "Back":
@@ -205,21 +213,45 @@ def installations_related_menu():
             else:
                 print("\nAborting Minecraft installation!")
 
+        elif action == "Install multiple MC versions":
+            from .installer import batch_install
+            batch_install()
+
         elif action == "Delete existing MC version":
+            from .installer import delete_version
             delete_version()
 
+        elif action == "Clean up unused libraries/assets":
+            from .installer import run_garbage_collection
+            run_garbage_collection()
+
+        elif action == "Deduplicate into shared store":
+            from .asset_store import deduplicate_current_dir
+            deduplicate_current_dir()
+
         elif action == "Back":
             clearscreen()
             break
 
 
-def main():
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        from .cli import run
+        return run(argv)
+
+    import questionary
+    from questionary import Separator
+    from .skin_journal import replay_journal
+    replay_journal()
+
     while True:
         action = questionary.select(
             "What do you want to do?",
             choices=[
                 "Launcher",
                 "Install new MC version",
+                "Running instances",
                 "Other",
                 Separator(" "),
                 "Exit"
@@ -227,9 +259,12 @@ def main():
         ).ask()
 
         if action == "Launcher":
+            from .launcher import run_launcher
             run_launcher()
 
         elif action == "Install new MC version":
+            from .install_wizard import run_install_wizard
+            from .installer import install_version
             install_info = run_install_wizard()
             if install_info != "Back":
                 install_version(install_info)
@@ -237,6 +272,10 @@ def main():
             else:
                 print("\nAborting Minecraft installation!")
 
+        elif action == "Running instances":
+            from .process_supervisor import instances_menu
+            instances_menu()
+
         elif action == "Other":
             sub_action = questionary.select(
                 "Other options:",
@@ -271,9 +310,12 @@ def main():
                 continue
 
         elif action == "Exit":
+            supervisor = sys.modules.get(f"{__package__}.process_supervisor")
+            if supervisor and supervisor.running_count():
+                print(f"\n{supervisor.running_count()} Minecraft instance(s) are still running and will keep running; their output is still logged to min_logs/.")
             print("\nExiting launcher. Goodbye!\n")
             break
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
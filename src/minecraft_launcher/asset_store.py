@@ -0,0 +1,179 @@
+import os
+import sys
+import uuid
+import shutil
+import hashlib
+from .path_manager import get_minecraft_dir
+from .config_store import get_value
+
+STORE_ENV_VAR = "MINECRAFT_LAUNCHER_STORE"
+FICLONE = 0x40049409
+CHUNK_SIZE = 1024 * 1024
+
+
+def get_store_dir():
+    store_dir = os.environ.get(STORE_ENV_VAR) or get_value("shared_store_dir")
+    if not store_dir:
+        return None
+    store_dir = os.path.abspath(os.path.expanduser(store_dir))
+    os.makedirs(store_dir, exist_ok=True)
+    return store_dir
+
+
+def store_path(store_dir: str, sha1: str) -> str:
+    return os.path.join(store_dir, sha1[:2], sha1)
+
+
+def _file_sha1(path: str) -> str:
+    hasher = hashlib.sha1()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _reflink(src, dst):
+    if not sys.platform.startswith("linux"):
+        raise OSError("reflink not supported on this platform")
+    import fcntl
+    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+
+def _clone_or_copy(src: str, tmp_path: str) -> str:
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0))
+    with open(src, "rb") as s, open(fd, "wb") as d:
+        try:
+            _reflink(s, d)
+            method = "reflink"
+        except OSError:
+            s.seek(0)
+            d.seek(0)
+            d.truncate()
+            shutil.copyfileobj(s, d, CHUNK_SIZE)
+            method = "copy"
+    shutil.copystat(src, tmp_path)
+    return method
+
+
+def link_file(src: str, dst: str) -> str:
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    tmp_path = f"{dst}.{uuid.uuid4().hex}.link"
+
+    try:
+        try:
+            os.link(src, tmp_path)
+            method = "hardlink"
+        except OSError:
+            method = _clone_or_copy(src, tmp_path)
+        os.replace(tmp_path, dst)
+    finally:
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+    return method
+
+
+def _same_file(a: str, b: str) -> bool:
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
+
+
+def fetch_from_store(store_dir: str, sha1: str, dest: str) -> bool:
+    source = store_path(store_dir, sha1)
+    if not os.path.isfile(source):
+        return False
+    if not _same_file(source, dest):
+        link_file(source, dest)
+    return True
+
+
+def add_to_store(store_dir: str, sha1: str, path: str, verified: bool = False) -> int:
+    if not verified and _file_sha1(path) != sha1:
+        raise ValueError(f"{path} does not match SHA-1 {sha1}")
+
+    target = store_path(store_dir, sha1)
+    if not os.path.isfile(target) or os.path.getsize(target) != os.path.getsize(path):
+        link_file(path, target)
+        return 0
+
+    if _same_file(target, path):
+        return 0
+
+    size = os.path.getsize(path)
+    if link_file(target, path) == "copy":
+        return 0
+    return size
+
+
+def _tree_files(root: str):
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.endswith((".part", ".link")):
+                continue
+            yield os.path.join(dirpath, filename)
+
+
+def deduplicate_minecraft_dir(minecraft_dir: str, store_dir: str) -> dict:
+    result = {"files": 0, "bytes_saved": 0, "corrupt": 0, "failed": 0}
+
+    objects_dir = os.path.join(minecraft_dir, "assets", "objects")
+    hashed_dirs = [
+        os.path.join(minecraft_dir, "libraries"),
+        os.path.join(minecraft_dir, "versions"),
+    ]
+
+    candidates = [(path, os.path.basename(path)) for path in _tree_files(objects_dir)]
+    for root in hashed_dirs:
+        candidates.extend((path, None) for path in _tree_files(root) if path.endswith(".jar"))
+
+    for path, sha1 in candidates:
+        try:
+            if sha1:
+                result["bytes_saved"] += add_to_store(store_dir, sha1, path)
+            else:
+                result["bytes_saved"] += add_to_store(store_dir, _file_sha1(path), path, verified=True)
+            result["files"] += 1
+        except ValueError:
+            result["corrupt"] += 1
+        except Exception:
+            result["failed"] += 1
+
+    return result
+
+
+def prune_store(store_dir: str, dry_run: bool = False) -> dict:
+    result = {"files": 0, "bytes": 0, "failed": 0}
+
+    for path in _tree_files(store_dir):
+        try:
+            st = os.lstat(path)
+            if st.st_nlink > 1:
+                continue
+            if not dry_run:
+                os.remove(path)
+        except OSError:
+            result["failed"] += 1
+            continue
+        result["files"] += 1
+        result["bytes"] += st.st_size
+
+    return result
+
+
+def deduplicate_current_dir():
+    store_dir = get_store_dir()
+    if not store_dir:
+        print(f"\nNo shared store configured. Set 'shared_store_dir' in launcher_config.json "
+              f"or the {STORE_ENV_VAR} environment variable.\n")
+        return
+
+    minecraft_dir = get_minecraft_dir()
+    print(f"\n[Shared Store] Linking {minecraft_dir} into {store_dir}...")
+
+    result = deduplicate_minecraft_dir(minecraft_dir, store_dir)
+    print(f"Processed {result['files']} file(s), reclaimed {result['bytes_saved'] / (1024 * 1024):.1f} MiB.")
+    if result["corrupt"]:
+        print(f"{result['corrupt']} asset object(s) do not match their hash and were left out of the store.")
+    if result["failed"]:
+        print(f"{result['failed']} file(s) could not be linked.")
@@ -0,0 +1,239 @@
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import contextlib
+from .config_store import get_value
+from .path_manager import DEFAULT_MIN_DIR, MINECRAFT_DIR_ENV_VAR
+from .jvm_tuning import PRESETS, DEFAULT_PRESET, validate_ram
+from .skin_journal import replay_journal
+
+LOADERS = {"vanilla": None, "forge": "Forge", "fabric": "Fabric"}
+
+
+def _profile_file(name: str) -> str:
+    return name if name.endswith(".json") else f"{name}.json"
+
+
+def _cmd_launch(args) -> dict:
+    from .launcher import get_minecraft_dir, load_profile, launch_version
+
+    profile_file = _profile_file(args.profile)
+    profile = load_profile(profile_file)
+    instance = launch_version(args.version, profile_file, profile, get_minecraft_dir())
+
+    result = {
+        "version": args.version,
+        "profile": profile_file,
+        "pid": instance["pid"],
+        "log_path": instance["log_path"],
+        "timings": instance["timings"],
+    }
+
+    if args.wait:
+        from .process_supervisor import wait_instance
+        exit_code = wait_instance(instance["pid"])
+        result["exit_code"] = exit_code
+        result["ok"] = exit_code == 0
+        if instance.get("crash"):
+            result["crash"] = instance["crash"]
+    return result
+
+
+def _cmd_install(args) -> dict:
+    from .installer import perform_install, install_versions
+    from .path_manager import get_minecraft_dir
+
+    minecraft_dir = get_minecraft_dir()
+    loaders = list(dict.fromkeys(args.loader or ["vanilla"]))
+    versions = list(dict.fromkeys(args.version))
+
+    if len(versions) == 1 and len(loaders) == 1:
+        timings = perform_install(versions[0], LOADERS[loaders[0]], minecraft_dir)
+        return {"version": versions[0], "loader": loaders[0], "minecraft_dir": minecraft_dir, "timings": timings}
+
+    specs = [(version, LOADERS[loader]) for version in versions for loader in loaders]
+    summary = install_versions(specs, minecraft_dir)
+    failed = [entry for entry in summary["versions"] if not entry["ok"]]
+    result = {"minecraft_dir": minecraft_dir, **summary, "ok": not failed}
+    if failed:
+        result["error"] = f"{len(failed)} of {len(specs)} installation(s) failed"
+    return result
+
+
+def _cmd_skins_import(args) -> dict:
+    from .skin_manager import import_skins
+    result = import_skins(args.paths, overwrite=args.overwrite)
+    if result["failed"]:
+        result["ok"] = False
+        result["error"] = f"{len(result['failed'])} skin pack(s) failed to build"
+    return result
+
+
+def _cmd_skins_find(args) -> dict:
+    from .skin_index import search_skins
+    matches = search_skins(args.path, os.path.abspath("min_skin"), args.max_distance)
+    return {"exact": matches["exact"], "near": [{"skin": name, "distance": d} for name, d in matches["near"]]}
+
+
+def _cmd_skins_watch(args) -> dict:
+    from .skin_watcher import watch_skins
+    return watch_skins(debounce=args.debounce, poll=args.poll)
+
+
+def _cmd_profiles_create(args) -> dict:
+    from .profile_applier import apply_profile
+
+    if not re.match(r"^[A-Za-z0-9_]{3,16}$", args.username):
+        raise ValueError("Invalid username (3-16 chars, letters/numbers/_ only)")
+    ram_check = validate_ram(args.ram)
+    if ram_check is not True:
+        raise ValueError(ram_check)
+
+    profile_path = os.path.join(os.path.abspath("min_configs"), _profile_file(args.name))
+    if os.path.exists(profile_path) and not args.overwrite:
+        raise ValueError(f"Profile '{_profile_file(args.name)}' already exists (use --overwrite).")
+
+    config = {
+        "account_type": "offline",
+        "username": args.username,
+        "ram_amount": args.ram,
+        "jvm_preset": args.jvm_preset,
+        "disable_multiplayer": args.disable_multiplayer,
+        "disable_chat": args.disable_chat,
+    }
+    return {"profile_path": apply_profile(config, profile_name=args.name)}
+
+
+def _cmd_profiles_list(args) -> dict:
+    config_dir = os.path.abspath("min_configs")
+    profiles = []
+    if os.path.isdir(config_dir):
+        profiles = sorted(f for f in os.listdir(config_dir) if f.endswith(".json"))
+    return {"profiles": profiles}
+
+
+def _cmd_versions_list(args) -> dict:
+    if args.installed:
+        from .path_manager import get_minecraft_dir
+        from .version_index import get_installed_versions
+        versions = get_installed_versions(get_minecraft_dir())
+        fields = ("id", "type", "inheritsFrom", "loader", "size", "last_played")
+    else:
+        from .manifest_cache import get_version_list
+        versions = get_version_list()
+        fields = ("id", "type")
+
+    if args.type != "all":
+        versions = [v for v in versions if (v["type"] == "release") == (args.type == "release")]
+    return {"versions": [{f: v.get(f) for f in fields} for v in versions]}
+
+
+def _cmd_runtimes_list(args) -> dict:
+    from .java_runtimes import discover_runtimes, select_runtime
+    from .jvm_tuning import java_major_for_version
+    from .path_manager import get_minecraft_dir
+    from .version_index import get_installed_versions
+
+    minecraft_dir = get_minecraft_dir()
+    runtimes = discover_runtimes(minecraft_dir)
+    versions = []
+    for entry in get_installed_versions(minecraft_dir):
+        required = java_major_for_version(entry["id"], minecraft_dir)
+        runtime = select_runtime(required, runtimes)
+        versions.append({"id": entry["id"], "java_major": required, "runtime": runtime["home"] if runtime else None})
+
+    fields = ("home", "executable", "version", "major", "arch", "bundled")
+    return {"runtimes": [{f: r[f] for f in fields} for r in runtimes], "versions": versions}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m minecraft_launcher",
+        description="Headless launcher interface. Run without arguments for the interactive menu."
+    )
+    parser.add_argument("--minecraft-dir", help="Minecraft directory to use instead of the configured one")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    launch = commands.add_parser("launch", help="Launch an installed version with a profile")
+    launch.add_argument("--version", required=True)
+    launch.add_argument("--profile", required=True)
+    launch.add_argument("--wait", action="store_true", help="Wait for the game to exit and report its exit code")
+    launch.set_defaults(handler=_cmd_launch)
+
+    install = commands.add_parser("install", help="Install one or more Minecraft versions")
+    install.add_argument("--version", required=True, action="append",
+                         help="Version to install; repeat to batch several versions over one download queue")
+    install.add_argument("--loader", choices=sorted(LOADERS), action="append",
+                         help="Modloader to install (default vanilla); repeat to install several per version")
+    install.set_defaults(handler=_cmd_install)
+
+    skins = commands.add_parser("skins", help="Skin pack operations")
+    skin_commands = skins.add_subparsers(dest="skins_command", required=True)
+    skins_import = skin_commands.add_parser("import", help="Import skin images or directories of images")
+    skins_import.add_argument("paths", nargs="+")
+    skins_import.add_argument("--overwrite", action="store_true")
+    skins_import.set_defaults(handler=_cmd_skins_import)
+    skins_find = skin_commands.add_parser("find", help="Find library skins identical or similar to an image")
+    skins_find.add_argument("path")
+    skins_find.add_argument("--max-distance", type=int, default=12, help="Perceptual hash distance for near matches")
+    skins_find.set_defaults(handler=_cmd_skins_find)
+    skins_watch = skin_commands.add_parser("watch", help="Build, rename and remove skin packs as min_skin/ changes")
+    skins_watch.add_argument("--debounce", type=float, default=1.0, help="Seconds of quiet before a batch is built")
+    skins_watch.add_argument("--poll", action="store_true", help="Poll min_skin/ instead of using inotify")
+    skins_watch.set_defaults(handler=_cmd_skins_watch)
+
+    profiles = commands.add_parser("profiles", help="Profile operations")
+    profile_commands = profiles.add_subparsers(dest="profiles_command", required=True)
+    profiles_create = profile_commands.add_parser("create", help="Create an offline profile")
+    profiles_create.add_argument("--name", required=True)
+    profiles_create.add_argument("--username", required=True)
+    profiles_create.add_argument("--ram", default="auto", help="Heap size such as 4G or 4096M, or auto")
+    profiles_create.add_argument("--jvm-preset", choices=list(PRESETS), default=DEFAULT_PRESET)
+    profiles_create.add_argument("--disable-multiplayer", action="store_true")
+    profiles_create.add_argument("--disable-chat", action="store_true")
+    profiles_create.add_argument("--overwrite", action="store_true")
+    profiles_create.set_defaults(handler=_cmd_profiles_create)
+    profiles_list = profile_commands.add_parser("list", help="List profiles")
+    profiles_list.set_defaults(handler=_cmd_profiles_list)
+
+    versions = commands.add_parser("versions", help="Version listings")
+    version_commands = versions.add_subparsers(dest="versions_command", required=True)
+    versions_list = version_commands.add_parser("list", help="List available or installed versions")
+    versions_list.add_argument("--installed", action="store_true")
+    versions_list.add_argument("--type", choices=["all", "release", "snapshot"], default="all")
+    versions_list.set_defaults(handler=_cmd_versions_list)
+
+    runtimes = commands.add_parser("runtimes", help="Java runtime discovery")
+    runtime_commands = runtimes.add_subparsers(dest="runtimes_command", required=True)
+    runtimes_list = runtime_commands.add_parser("list", help="List Java runtimes and the one each installed version uses")
+    runtimes_list.set_defaults(handler=_cmd_runtimes_list)
+
+    return parser
+
+
+def run(argv: list) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.minecraft_dir:
+        os.environ[MINECRAFT_DIR_ENV_VAR] = os.path.abspath(args.minecraft_dir)
+    elif not os.environ.get(MINECRAFT_DIR_ENV_VAR) and not get_value("minecraft_dir"):
+        os.environ[MINECRAFT_DIR_ENV_VAR] = DEFAULT_MIN_DIR
+
+    command = " ".join(a for a in (args.command, getattr(args, f"{args.command}_command", None)) if a)
+    result = {"command": command, "ok": True}
+    started = time.perf_counter()
+
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            replay_journal()
+            result.update(args.handler(args))
+    except Exception as e:
+        result["ok"] = False
+        result["error"] = str(e)
+
+    result["elapsed"] = time.perf_counter() - started
+    print(json.dumps(result, indent=2, default=str))
+    return 0 if result["ok"] else 1
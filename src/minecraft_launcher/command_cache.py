@@ -0,0 +1,129 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+from .config_store import CACHE_DIR
+
+COMMAND_CACHE_FILE = os.path.join(CACHE_DIR, "launch_commands.json")
+MAX_ENTRIES = 50
+
+_memory_cache = None
+
+
+def _load_cache() -> dict:
+    global _memory_cache
+    if _memory_cache is not None:
+        return _memory_cache
+
+    _memory_cache = {}
+    if os.path.exists(COMMAND_CACHE_FILE):
+        try:
+            with open(COMMAND_CACHE_FILE, "r", encoding="utf-8") as f:
+                _memory_cache = json.load(f)
+        except Exception:
+            _memory_cache = {}
+    return _memory_cache
+
+
+def _save_cache(cache: dict):
+    if len(cache) > MAX_ENTRIES:
+        newest = sorted(cache.items(), key=lambda item: item[1].get("created", 0), reverse=True)
+        cache.clear()
+        cache.update(newest[:MAX_ENTRIES])
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=CACHE_DIR, prefix="launch_commands.", suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            json.dump(cache, f)
+        os.replace(tmp_path, COMMAND_CACHE_FILE)
+    except Exception as e:
+        print(f"Failed to write launch command cache: {e}")
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _cache_key(version: str, minecraft_dir: str, options: dict) -> str:
+    payload = json.dumps(
+        {"version": version, "minecraft_dir": os.path.abspath(minecraft_dir), "options": options},
+        sort_keys=True
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _stat_entry(path: str):
+    try:
+        st = os.stat(path)
+        return [path, st.st_mtime_ns, st.st_size]
+    except OSError:
+        return [path, None, None]
+
+
+def _version_json_chain(version: str, minecraft_dir: str) -> list:
+    paths = []
+    current = version
+    while current and len(paths) < 10:
+        json_path = os.path.join(minecraft_dir, "versions", current, f"{current}.json")
+        paths.append(json_path)
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                current = json.load(f).get("inheritsFrom")
+        except Exception:
+            break
+    return paths
+
+
+def _classpath_entries(command: list) -> list:
+    for flag in ("-cp", "-classpath", "--class-path"):
+        if flag in command:
+            index = command.index(flag)
+            if index + 1 < len(command):
+                return [p for p in command[index + 1].split(os.pathsep) if p]
+    return []
+
+
+def _fingerprint(version: str, minecraft_dir: str, command: list) -> list:
+    paths = _version_json_chain(version, minecraft_dir)
+    paths.append(os.path.join(minecraft_dir, "libraries"))
+    paths.extend(_classpath_entries(command))
+    if command and os.path.isabs(command[0]):
+        paths.append(command[0])
+    return [_stat_entry(p) for p in paths]
+
+
+def _is_fresh(fingerprint: list) -> bool:
+    return all(_stat_entry(path) == [path, mtime, size] for path, mtime, size in fingerprint)
+
+
+def get_cached_command(version: str, minecraft_dir: str, options: dict):
+    entry = _load_cache().get(_cache_key(version, minecraft_dir, options))
+    if entry and _is_fresh(entry["fingerprint"]):
+        return list(entry["command"])
+    return None
+
+
+def get_minecraft_command(version: str, minecraft_dir: str, options: dict) -> list:
+    cached = get_cached_command(version, minecraft_dir, options)
+    if cached is not None:
+        return cached
+
+    import minecraft_launcher_lib
+    command = minecraft_launcher_lib.command.get_minecraft_command(
+        version=version,
+        minecraft_directory=minecraft_dir,
+        options=options
+    )
+
+    cache = _load_cache()
+    cache[_cache_key(version, minecraft_dir, options)] = {
+        "command": command,
+        "fingerprint": _fingerprint(version, minecraft_dir, command),
+        "created": time.time(),
+    }
+    _save_cache(cache)
+    return command
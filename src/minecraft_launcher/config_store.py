@@ -0,0 +1,130 @@
+import os
+import json
+import copy
+import threading
+from contextlib import contextmanager
+
+CONFIG_FILE = os.path.abspath("launcher_config.json")
+CACHE_DIR = os.path.abspath("min_cache")
+
+_cache = {}
+_thread_lock = threading.RLock()
+_local = threading.local()
+
+
+@contextmanager
+def file_lock(path: str, blocking: bool = True):
+    lock_path = f"{path}.lock"
+    os.makedirs(os.path.dirname(os.path.abspath(lock_path)), exist_ok=True)
+
+    with open(lock_path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    if not blocking:
+                        raise BlockingIOError(f"{lock_path} is locked")
+                    continue
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _signature(path: str):
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+
+def _read(path: str, force: bool = False) -> dict:
+    signature = _signature(path)
+    cached = _cache.get(path)
+    if cached and cached[0] == signature and not force:
+        return cached[1]
+
+    data = {}
+    if signature is not None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Failed to read {os.path.basename(path)}: {e}")
+            data = {}
+    if not isinstance(data, dict):
+        data = {}
+
+    _cache[path] = (signature, data)
+    return data
+
+
+def _write_atomic(path: str, data: dict):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    _cache[path] = (_signature(path), copy.deepcopy(data))
+
+
+def load_config(path: str = CONFIG_FILE) -> dict:
+    with _thread_lock:
+        return copy.deepcopy(_read(path))
+
+
+def get_value(key: str, default=None, path: str = CONFIG_FILE):
+    with _thread_lock:
+        return copy.deepcopy(_read(path).get(key, default))
+
+
+@contextmanager
+def edit_config(path: str = CONFIG_FILE):
+    pending = getattr(_local, "pending", None)
+    if pending is None:
+        pending = _local.pending = {}
+
+    if path in pending:
+        yield pending[path]
+        return
+
+    with _thread_lock, file_lock(path):
+        data = copy.deepcopy(_read(path, force=True))
+        original = copy.deepcopy(data)
+        pending[path] = data
+        try:
+            yield data
+            if data != original:
+                _write_atomic(path, data)
+        finally:
+            del pending[path]
+
+
+def set_value(key: str, value, path: str = CONFIG_FILE):
+    with edit_config(path) as data:
+        data[key] = value
+
+
+def save_config(config: dict, path: str = CONFIG_FILE):
+    with edit_config(path) as data:
+        data.clear()
+        data.update(copy.deepcopy(config))
@@ -1,7 +1,7 @@
 import os
 import re
 import questionary
-import minecraft_launcher_lib
+from .jvm_tuning import PRESETS, DEFAULT_PRESET, validate_ram
 
 
 def _select_account_type():
@@ -32,21 +32,17 @@ def _get_player_settings():
         if username:
             break
 
-    def _validate_ram(ram: str):
-        if not re.match(r"^\d+[GM]$", ram, re.IGNORECASE):
-            return "Invalid format. Use e.g., 4G or 4096M."
-        value = int(re.match(r"^(\d+)", ram).group(1))
-        if ram.upper().endswith("G") and value < 4:
-            return "Minimum RAM is 4G."
-        if ram.upper().endswith("M") and value < 4096:
-            return "Minimum RAM is 4096M."
-        return True
+    jvm_preset = questionary.select(
+        "Select JVM tuning preset:",
+        choices=[questionary.Choice(f"{name} - {description}", value=name) for name, description in PRESETS.items()],
+        default=DEFAULT_PRESET
+    ).ask() or DEFAULT_PRESET
 
     while True:
         ram_amount = questionary.text(
-            "Enter RAM amount (e.g., 4G, 4096M) [Default = 4G]:",
-            default="4G",
-            validate=_validate_ram
+            "Enter RAM amount (e.g., 4G, 4096M, auto) [Default = auto, sized from host memory]:",
+            default="auto",
+            validate=validate_ram
         ).ask()
         if ram_amount:
             break
@@ -56,7 +52,8 @@ def _get_player_settings():
 
     return {
         "username": username,
-        "ram_amount": ram_amount or "4G",
+        "jvm_preset": jvm_preset,
+        "ram_amount": ram_amount or "auto",
         "disable_multiplayer": disable_multiplayer,
         "disable_chat": disable_chat,
     }
@@ -0,0 +1,347 @@
+import os
+import sys
+import json
+import hashlib
+import platform
+import threading
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from tqdm import tqdm
+from .asset_store import fetch_from_store, add_to_store
+from .manifest_cache import VERSION_MANIFEST_URL, get_version_manifest
+
+RESOURCES_URL = "https://resources.download.minecraft.net"
+DEFAULT_WORKERS = 16
+DEFAULT_TIMEOUT = 30
+DEFAULT_RETRIES = 2
+CHUNK_SIZE = 64 * 1024
+USER_AGENT = "minecraft-launcher"
+
+_index_locks = {}
+_index_locks_guard = threading.Lock()
+
+
+def _os_name() -> str:
+    if sys.platform.startswith("win"):
+        return "windows"
+    if sys.platform == "darwin":
+        return "osx"
+    return "linux"
+
+
+def _rules_allow(rules) -> bool:
+    if not rules:
+        return True
+
+    allowed = False
+    for rule in rules:
+        if "features" in rule:
+            continue
+        os_rule = rule.get("os", {})
+        if "name" in os_rule and os_rule["name"] != _os_name():
+            continue
+        if os_rule.get("arch") == "x86" and platform.architecture()[0] != "32bit":
+            continue
+        allowed = rule.get("action") == "allow"
+    return allowed
+
+
+def _maven_path(name: str) -> str:
+    coordinate, _, ext = name.partition("@")
+    parts = coordinate.split(":")
+    group, artifact, version = parts[0], parts[1], parts[2]
+    classifier = f"-{parts[3]}" if len(parts) > 3 else ""
+    filename = f"{artifact}-{version}{classifier}.{ext or 'jar'}"
+    return "/".join(group.split(".") + [artifact, version, filename])
+
+
+def _file_sha1(path: str) -> str:
+    hasher = hashlib.sha1()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _is_complete(task: dict) -> bool:
+    path = task["path"]
+    if not os.path.isfile(path):
+        return False
+    if task.get("size") is not None:
+        return os.path.getsize(path) == task["size"]
+    if task.get("sha1"):
+        return _file_sha1(path) == task["sha1"]
+    return True
+
+
+def download_file(url: str, path: str, sha1: str = None, size: int = None,
+                  progress=None, timeout: int = DEFAULT_TIMEOUT) -> int:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    part_path = path + ".part"
+    hasher = hashlib.sha1()
+    offset = 0
+
+    if os.path.isfile(part_path):
+        offset = os.path.getsize(part_path)
+        if offset and (size is None or offset < size):
+            with open(part_path, "rb") as f:
+                while chunk := f.read(CHUNK_SIZE):
+                    hasher.update(chunk)
+        else:
+            os.remove(part_path)
+            offset = 0
+
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+
+    try:
+        response = urllib.request.urlopen(request, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        if e.code == 416 and offset:
+            os.remove(part_path)
+            return download_file(url, path, sha1, size, progress, timeout)
+        raise
+
+    written = 0
+    with response:
+        if offset and response.status != 206:
+            offset = 0
+            hasher = hashlib.sha1()
+
+        with open(part_path, "ab" if offset else "wb") as f:
+            while chunk := response.read(CHUNK_SIZE):
+                f.write(chunk)
+                hasher.update(chunk)
+                written += len(chunk)
+                if progress:
+                    progress(len(chunk))
+
+    if sha1 and hasher.hexdigest() != sha1:
+        os.remove(part_path)
+        raise ValueError(f"SHA-1 mismatch for {os.path.basename(path)}")
+
+    os.replace(part_path, path)
+    return written
+
+
+def _task(url: str, path: str, sha1: str = None, size: int = None) -> dict:
+    return {"url": url, "path": path, "sha1": sha1, "size": size}
+
+
+def _library_tasks(version_data: dict, minecraft_dir: str) -> list:
+    libraries_dir = os.path.join(minecraft_dir, "libraries")
+    arch = "32" if platform.architecture()[0] == "32bit" else "64"
+    tasks = []
+
+    for library in version_data.get("libraries", []):
+        if not _rules_allow(library.get("rules")):
+            continue
+
+        downloads = library.get("downloads")
+        if downloads is None:
+            if "name" in library:
+                rel_path = _maven_path(library["name"])
+                base_url = library.get("url", "https://libraries.minecraft.net/").rstrip("/")
+                tasks.append(_task(
+                    f"{base_url}/{rel_path}",
+                    os.path.join(libraries_dir, rel_path),
+                    library.get("sha1"),
+                    library.get("size")
+                ))
+            continue
+
+        artifact = downloads.get("artifact")
+        if artifact and artifact.get("url"):
+            tasks.append(_task(
+                artifact["url"],
+                os.path.join(libraries_dir, artifact["path"]),
+                artifact.get("sha1"),
+                artifact.get("size")
+            ))
+
+        classifier = library.get("natives", {}).get(_os_name())
+        if classifier:
+            native = downloads.get("classifiers", {}).get(classifier.replace("${arch}", arch))
+            if native and native.get("url"):
+                tasks.append(_task(
+                    native["url"],
+                    os.path.join(libraries_dir, native["path"]),
+                    native.get("sha1"),
+                    native.get("size")
+                ))
+
+    return tasks
+
+
+def _client_tasks(version_id: str, version_data: dict, minecraft_dir: str) -> list:
+    tasks = []
+    client = version_data.get("downloads", {}).get("client")
+    if client:
+        tasks.append(_task(
+            client["url"],
+            os.path.join(minecraft_dir, "versions", version_id, f"{version_id}.jar"),
+            client.get("sha1"),
+            client.get("size")
+        ))
+
+    logging_file = version_data.get("logging", {}).get("client", {}).get("file")
+    if logging_file:
+        tasks.append(_task(
+            logging_file["url"],
+            os.path.join(minecraft_dir, "assets", "log_configs", logging_file["id"]),
+            logging_file.get("sha1"),
+            logging_file.get("size")
+        ))
+    return tasks
+
+
+def _index_lock(path: str) -> threading.Lock:
+    with _index_locks_guard:
+        return _index_locks.setdefault(os.path.normcase(os.path.abspath(path)), threading.Lock())
+
+
+def _asset_tasks(version_data: dict, minecraft_dir: str, resources_url: str) -> list:
+    asset_index = version_data.get("assetIndex")
+    if not asset_index:
+        return []
+
+    index_path = os.path.join(minecraft_dir, "assets", "indexes", f"{asset_index['id']}.json")
+    with _index_lock(index_path):
+        if not _is_complete(_task(asset_index["url"], index_path, asset_index.get("sha1"), asset_index.get("size"))):
+            download_file(asset_index["url"], index_path, asset_index.get("sha1"), asset_index.get("size"))
+
+    with open(index_path, "r", encoding="utf-8") as f:
+        objects = json.load(f).get("objects", {})
+
+    objects_dir = os.path.join(minecraft_dir, "assets", "objects")
+    tasks = []
+    for obj in objects.values():
+        object_hash = obj["hash"]
+        tasks.append(_task(
+            f"{resources_url}/{object_hash[:2]}/{object_hash}",
+            os.path.join(objects_dir, object_hash[:2], object_hash),
+            object_hash,
+            obj.get("size")
+        ))
+    return tasks
+
+
+def load_version_json(version_id: str, minecraft_dir: str, manifest_url: str = VERSION_MANIFEST_URL) -> dict:
+    json_path = os.path.join(minecraft_dir, "versions", version_id, f"{version_id}.json")
+    if os.path.isfile(json_path):
+        with open(json_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    manifest = get_version_manifest(url=manifest_url)
+    entry = next((v for v in manifest.get("versions", []) if v["id"] == version_id), None)
+    if entry is None:
+        raise ValueError(f"Version '{version_id}' not found in the version manifest")
+
+    download_file(entry["url"], json_path, entry.get("sha1"))
+    with open(json_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def collect_version_downloads(version_id: str, minecraft_dir: str,
+                              manifest_url: str = VERSION_MANIFEST_URL,
+                              resources_url: str = RESOURCES_URL) -> list:
+    version_data = load_version_json(version_id, minecraft_dir, manifest_url)
+
+    tasks = []
+    tasks.extend(_library_tasks(version_data, minecraft_dir))
+    tasks.extend(_client_tasks(version_id, version_data, minecraft_dir))
+    tasks.extend(_asset_tasks(version_data, minecraft_dir, resources_url))
+    return _dedupe(tasks)
+
+
+def _dedupe(tasks: list) -> list:
+    unique = {}
+    for task in tasks:
+        unique.setdefault(os.path.normcase(os.path.abspath(task["path"])), task)
+    return list(unique.values())
+
+
+def collect_batch_downloads(version_ids: list, minecraft_dir: str, max_workers: int = DEFAULT_WORKERS,
+                            manifest_url: str = VERSION_MANIFEST_URL,
+                            resources_url: str = RESOURCES_URL) -> tuple:
+    tasks = []
+    failed = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(collect_version_downloads, version_id, minecraft_dir, manifest_url, resources_url): version_id
+            for version_id in dict.fromkeys(version_ids)
+        }
+        for future in as_completed(futures):
+            try:
+                tasks.extend(future.result())
+            except Exception as e:
+                failed.append((futures[future], str(e)))
+
+    return _dedupe(tasks), failed
+
+
+def download_all(tasks: list, max_workers: int = DEFAULT_WORKERS, desc: str = "Downloading",
+                 retries: int = DEFAULT_RETRIES, store_dir: str = None, force: bool = False) -> dict:
+    pending = list(tasks) if force else [t for t in tasks if not _is_complete(t)]
+    result = {"downloaded": 0, "linked": 0, "skipped": len(tasks) - len(pending), "bytes": 0, "failed": []}
+
+    if not pending:
+        return result
+
+    total = sum(t.get("size") or 0 for t in pending) or None
+    lock = threading.Lock()
+    bar = tqdm(total=total, desc=desc, unit="B", unit_scale=True, ncols=100, colour="white")
+
+    def _progress(n: int):
+        with lock:
+            bar.update(n)
+
+    def _run(task: dict):
+        sha1 = task.get("sha1")
+        if store_dir and sha1 and fetch_from_store(store_dir, sha1, task["path"]):
+            _progress(task.get("size") or 0)
+            return None
+
+        for attempt in range(retries + 1):
+            try:
+                written = download_file(task["url"], task["path"], sha1, task.get("size"), _progress)
+                break
+            except Exception:
+                if attempt == retries:
+                    raise
+
+        if store_dir and sha1:
+            try:
+                add_to_store(store_dir, sha1, task["path"], verified=True)
+            except OSError as e:
+                print(f"Failed to add {task['path']} to the shared store: {e}")
+        return written
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(_run, task): task for task in pending}
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    written = future.result()
+                    if written is None:
+                        result["linked"] += 1
+                    else:
+                        result["bytes"] += written
+                        result["downloaded"] += 1
+                except Exception as e:
+                    result["failed"].append((task["path"], str(e)))
+    finally:
+        bar.close()
+
+    return result
+
+
+def prefetch_version(version_id: str, minecraft_dir: str, max_workers: int = DEFAULT_WORKERS,
+                     manifest_url: str = VERSION_MANIFEST_URL,
+                     resources_url: str = RESOURCES_URL, store_dir: str = None) -> dict:
+    tasks = collect_version_downloads(version_id, minecraft_dir, manifest_url, resources_url)
+    return download_all(tasks, max_workers=max_workers, desc=f"Downloading {version_id}", store_dir=store_dir)
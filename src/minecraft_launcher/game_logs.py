@@ -0,0 +1,165 @@
+import os
+import re
+import gzip
+import time
+import shutil
+import logging
+import threading
+from collections import deque
+from logging.handlers import RotatingFileHandler
+import questionary
+from questionary import Separator
+from .config_store import load_config, edit_config
+
+LOG_DIR = os.path.abspath("min_logs")
+CRASH_INDEX_FILE = os.path.join(LOG_DIR, "crash_index.json")
+RING_BUFFER_LINES = 2000
+MAX_LOG_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+MAX_CRASHES_PER_KEY = 20
+
+_EXCEPTION_RE = re.compile(r"((?:[A-Za-z_$][\w$]*\.)+[A-Z][\w$]*(?:Exception|Error|Throwable))\b(?::|\s*$)")
+_FRAME_RE = re.compile(r"^\s*at ([\w$.<>/]+)\(")
+
+
+def _gzip_rotator(source: str, dest: str):
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+def _open_logger(log_path: str) -> logging.Logger:
+    logger = logging.getLogger(f"minecraft_launcher.game.{os.path.basename(log_path)}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    handler = RotatingFileHandler(log_path, maxBytes=MAX_LOG_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8")
+    handler.namer = lambda name: f"{name}.gz"
+    handler.rotator = _gzip_rotator
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    return logger
+
+
+def _close_logger(logger: logging.Logger):
+    for handler in list(logger.handlers):
+        handler.close()
+        logger.removeHandler(handler)
+
+
+def _pump(stream, buffer: deque, logger: logging.Logger, prefix: str):
+    with stream:
+        for raw in iter(stream.readline, b""):
+            line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+            buffer.append(line)
+            logger.info(f"{prefix}{line}")
+
+
+def start_capture(process, log_path: str) -> dict:
+    capture = {
+        "buffer": deque(maxlen=RING_BUFFER_LINES),
+        "logger": _open_logger(log_path),
+        "threads": [],
+    }
+
+    for stream, prefix in ((process.stdout, ""), (process.stderr, "[stderr] ")):
+        thread = threading.Thread(
+            target=_pump,
+            args=(stream, capture["buffer"], capture["logger"], prefix),
+            daemon=True
+        )
+        thread.start()
+        capture["threads"].append(thread)
+
+    return capture
+
+
+def finish_capture(capture: dict):
+    for thread in capture["threads"]:
+        thread.join()
+    _close_logger(capture["logger"])
+
+
+def extract_crash_signature(lines) -> dict:
+    exception = None
+    top_frame = None
+
+    for line in lines:
+        if line.lstrip().startswith("Caused by:"):
+            continue
+        match = _EXCEPTION_RE.search(line)
+        if match:
+            exception = match.group(1)
+            top_frame = None
+            continue
+        if exception and top_frame is None:
+            frame = _FRAME_RE.match(line)
+            if frame:
+                top_frame = frame.group(1)
+
+    return {"exception": exception, "top_frame": top_frame}
+
+
+def _crash_key(version: str, profile: str) -> str:
+    return f"{version}|{profile}"
+
+
+def record_crash(version: str, profile: str, exit_code: int, lines, log_path: str) -> dict:
+    entry = {
+        "time": time.time(),
+        "exit_code": exit_code,
+        **extract_crash_signature(lines),
+        "log_path": log_path,
+    }
+
+    with edit_config(CRASH_INDEX_FILE) as index:
+        crashes = index.setdefault(_crash_key(version, profile), [])
+        crashes.append(entry)
+        del crashes[:-MAX_CRASHES_PER_KEY]
+
+    return entry
+
+
+def find_crash(version: str, profile: str, log_path: str):
+    for entry in reversed(load_config(CRASH_INDEX_FILE).get(_crash_key(version, profile), [])):
+        if entry.get("log_path") == log_path:
+            return entry
+    return None
+
+
+def get_recent_crashes(version: str, profile: str = None, limit: int = 5) -> list:
+    index = load_config(CRASH_INDEX_FILE)
+    crashes = []
+    for key, entries in index.items():
+        key_version, _, key_profile = key.partition("|")
+        if key_version == version and (profile is None or key_profile == profile):
+            crashes.extend(dict(e, profile=key_profile) for e in entries)
+
+    crashes.sort(key=lambda e: e["time"], reverse=True)
+    return crashes[:limit]
+
+
+def show_recent_crashes():
+    index = load_config(CRASH_INDEX_FILE)
+    versions = sorted({key.partition("|")[0] for key in index})
+
+    if not versions:
+        print("\nNo crashes recorded.\n")
+        return
+
+    version = questionary.select(
+        "Show recent crashes for version:",
+        choices=versions + [Separator(" "), "Back"]
+    ).ask()
+
+    if version == "Back" or not version:
+        return
+
+    print(f"\n[Recent crashes for {version}]")
+    for crash in get_recent_crashes(version):
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(crash["time"]))
+        print(f" - {when} ({crash['profile']}) exit code {crash['exit_code']}")
+        print(f"   {crash['exception'] or 'No exception found'}"
+              + (f" at {crash['top_frame']}" if crash["top_frame"] else ""))
+        print(f"   log: {crash['log_path']}")
+    print()
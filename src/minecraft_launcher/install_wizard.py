@@ -1,4 +1,5 @@
 import questionary
+from questionary import Separator
 from .selector import select_version
 
 
@@ -42,3 +43,70 @@ def run_install_wizard():
             "selected_version": selected_version,
             "modloader": modloader
         }
+
+
+def _ask_release_range(releases: list):
+    start = questionary.autocomplete("Oldest release to install:", choices=releases).ask()
+    if not start:
+        return []
+    end = questionary.autocomplete("Newest release to install:", choices=releases, default=releases[0]).ask()
+    if not end:
+        return []
+
+    if start not in releases or end not in releases:
+        print("\nUnknown release, please pick one from the list.")
+        return []
+
+    first, last = sorted((releases.index(end), releases.index(start)))
+    return releases[first:last + 1]
+
+
+def run_batch_install_wizard():
+    from .manifest_cache import get_version_list
+
+    print("\n[Batch Minecraft Installation Setup]\n")
+
+    releases = [v["id"] for v in get_version_list() if v["type"] == "release"]
+    if not releases:
+        print("No releases available.")
+        return "Back"
+
+    mode = questionary.select(
+        "How would you like to pick versions?",
+        choices=["Select releases", "Release range", Separator(" "), "Back"]
+    ).ask()
+
+    if mode == "Back" or not mode:
+        return "Back"
+
+    if mode == "Release range":
+        versions = _ask_release_range(releases)
+    else:
+        versions = questionary.checkbox("Select releases to install:", choices=releases).ask() or []
+
+    if not versions:
+        return "Back"
+
+    modloaders = questionary.checkbox(
+        "Install with:",
+        choices=[questionary.Choice("Vanilla", checked=True), "Forge", "Fabric"]
+    ).ask()
+
+    if not modloaders:
+        return "Back"
+
+    specs = [
+        (version, None if modloader == "Vanilla" else modloader)
+        for version in versions
+        for modloader in modloaders
+    ]
+
+    print("\nSelection complete:")
+    print(f" - Versions: {', '.join(versions)}")
+    print(f" - Modloaders: {', '.join(modloaders)}")
+    print(f" - Installations: {len(specs)}")
+
+    if not questionary.confirm("Start the batch installation?", default=True).ask():
+        return "Back"
+
+    return specs
@@ -1,9 +1,13 @@
-import os
+import time
 from tqdm import tqdm
 import minecraft_launcher_lib
 from .path_manager import get_minecraft_dir
 import questionary
 from .selector import select_version
+from .downloader import prefetch_version, collect_batch_downloads, download_all
+from .asset_store import get_store_dir
+from .version_index import refresh_version_index, forget_version
+from .version_cleanup import delete_version_tree, find_dependents, collect_garbage
 
 _progress_bar = None
 _current_max = 0
@@ -47,36 +51,22 @@ CALLBACKS = {
 }
 
 
-def install_version(config: dict):
+def perform_install(version: str, modloader: str, minecraft_dir: str, prefetch: bool = True) -> dict:
     global _progress_bar
-
-    minecraft_dir = get_minecraft_dir()
-
-    version = config.get("selected_version")
-    modloader = config.get("modloader")
-
-    print(f"\n[Installer] Preparing to install Minecraft {version} ({modloader or 'Vanilla'})")
-    print(f"Install directory: {minecraft_dir}\n")
-
-    action = questionary.select(
-        "Do you want to proceed with the installation?",
-        choices=[
-            "Proceed",
-            "Abort"
-        ]
-    ).ask()
-
-    if action == "Abort":
-        print("\nInstallation aborted by user. Returning to previous menu.\n")
-        return "Back"
+    timings = {}
 
     try:
+        if prefetch:
+            started = time.perf_counter()
+            _prefetch_downloads(version, minecraft_dir)
+            timings["download"] = time.perf_counter() - started
+
+        started = time.perf_counter()
         if modloader == "Forge":
             print(f"Installing Forge for version {version}...")
             forge_version = minecraft_launcher_lib.forge.find_forge_version(version)
             if not forge_version:
-                print("No compatible Forge version found.")
-                return config
+                raise ValueError("No compatible Forge version found.")
             minecraft_launcher_lib.forge.install_forge_version(
                 forge_version, minecraft_dir, callback=CALLBACKS
             )
@@ -92,20 +82,113 @@ def install_version(config: dict):
             minecraft_launcher_lib.install.install_minecraft_version(
                 version, minecraft_dir, callback=CALLBACKS
             )
+        timings["install"] = time.perf_counter() - started
 
-        print("\nInstallation complete!")
-
-    except Exception as exc:
-        print(f"\nInstallation failed: {exc}")
+        try:
+            refresh_version_index(minecraft_dir, version)
+        except Exception as e:
+            print(f"Failed to update the installed version index: {e}")
 
     finally:
         if _progress_bar:
             _progress_bar.close()
             _progress_bar = None
 
+    return timings
+
+
+def install_version(config: dict, confirm: bool = True):
+    minecraft_dir = get_minecraft_dir()
+
+    version = config.get("selected_version")
+    modloader = config.get("modloader")
+
+    print(f"\n[Installer] Preparing to install Minecraft {version} ({modloader or 'Vanilla'})")
+    print(f"Install directory: {minecraft_dir}\n")
+
+    if confirm:
+        action = questionary.select(
+            "Do you want to proceed with the installation?",
+            choices=[
+                "Proceed",
+                "Abort"
+            ]
+        ).ask()
+
+        if action == "Abort":
+            print("\nInstallation aborted by user. Returning to previous menu.\n")
+            return "Back"
+
+    try:
+        perform_install(version, modloader, minecraft_dir)
+        print("\nInstallation complete!")
+    except Exception as exc:
+        print(f"\nInstallation failed: {exc}")
+
     return config
 
 
+def install_versions(specs: list, minecraft_dir: str = None) -> dict:
+    minecraft_dir = minecraft_dir or get_minecraft_dir()
+    base_versions = list(dict.fromkeys(version for version, _ in specs))
+
+    print(f"\n[Installer] Resolving files for {len(base_versions)} version(s)...")
+    started = time.perf_counter()
+    tasks, unresolved = collect_batch_downloads(base_versions, minecraft_dir)
+    for version, error in unresolved:
+        print(f"Could not resolve files for {version}: {error}")
+
+    download = download_all(tasks, desc=f"Downloading {len(base_versions)} version(s)", store_dir=get_store_dir())
+    download_seconds = time.perf_counter() - started
+    print(f"Fetched {download['downloaded']} file(s), linked {download['linked']} from the shared store, "
+          f"{download['skipped']} already present, {len(tasks)} unique file(s) in total.")
+
+    results = []
+    for version, modloader in specs:
+        entry = {"version": version, "modloader": modloader or "Vanilla", "ok": True}
+        try:
+            entry["timings"] = perform_install(version, modloader, minecraft_dir, prefetch=False)
+        except Exception as exc:
+            entry["ok"] = False
+            entry["error"] = str(exc)
+            print(f"\nInstallation of {version} ({entry['modloader']}) failed: {exc}")
+        results.append(entry)
+
+    return {
+        "unique_files": len(tasks),
+        "download": {k: v for k, v in download.items() if k != "failed"},
+        "download_failed": len(download["failed"]),
+        "download_seconds": download_seconds,
+        "versions": results,
+    }
+
+
+def batch_install():
+    from .install_wizard import run_batch_install_wizard
+
+    specs = run_batch_install_wizard()
+    if specs == "Back" or not specs:
+        print("\nAborting batch installation!")
+        return
+
+    summary = install_versions(specs)
+    installed = sum(1 for entry in summary["versions"] if entry["ok"])
+    print(f"\nBatch installation complete: {installed}/{len(specs)} installation(s) succeeded.")
+
+
+def _prefetch_downloads(version: str, minecraft_dir: str):
+    try:
+        result = prefetch_version(version, minecraft_dir, store_dir=get_store_dir())
+    except Exception as e:
+        print(f"Parallel download unavailable ({e}), falling back to the standard installer.")
+        return
+
+    print(f"Fetched {result['downloaded']} file(s), linked {result['linked']} from the shared store, "
+          f"{result['skipped']} already present.")
+    if result["failed"]:
+        print(f"{len(result['failed'])} file(s) failed to download and will be retried by the installer.")
+
+
 def delete_version():
     selected = select_version(mode="installed")
 
@@ -113,6 +196,12 @@ def delete_version():
         print("\nDeletion canceled.\n")
         return
 
+    minecraft_dir = get_minecraft_dir()
+    dependents = find_dependents(minecraft_dir, selected)
+    if dependents:
+        print(f"\nWarning: {', '.join(dependents)} inherit from '{selected}' and will stop working without it.")
+        print("Cleaning up unused libraries afterwards would also remove the libraries they depend on.")
+
     confirm = questionary.text(
         f"Type YES to confirm deletion of Minecraft version '{selected}':"
     ).ask()
@@ -121,16 +210,55 @@ def delete_version():
         print("\nDeletion aborted (confirmation not given).\n")
         return
 
-    minecraft_dir = get_minecraft_dir()
-    version_path = os.path.join(minecraft_dir, "versions", selected)
-
     try:
-        for root, dirs, files in os.walk(version_path, topdown=False):
-            for file in files:
-                os.remove(os.path.join(root, file))
-            for dir in dirs:
-                os.rmdir(os.path.join(root, dir))
-        os.rmdir(version_path)
-        print(f"\nMinecraft version '{selected}' successfully deleted.\n")
+        removed = delete_version_tree(minecraft_dir, selected, force=True)
+        print(f"\nMinecraft version '{selected}' successfully deleted "
+              f"({removed['files']} file(s), {_mib(removed['reclaimable'])} MiB).\n")
     except Exception as e:
         print(f"\nFailed to delete Minecraft version '{selected}': {e}\n")
+        return
+
+    try:
+        forget_version(minecraft_dir, selected)
+    except Exception as e:
+        print(f"Failed to update the installed version index: {e}")
+
+    if questionary.confirm(
+        "Remove libraries and assets no longer used by any installed version?",
+        default=False
+    ).ask():
+        run_garbage_collection(minecraft_dir)
+
+
+def _mib(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f}"
+
+
+def run_garbage_collection(minecraft_dir: str = None):
+    minecraft_dir = minecraft_dir or get_minecraft_dir()
+    store_dir = get_store_dir()
+
+    print(f"\n[Cleanup] Scanning {minecraft_dir} for unused libraries and assets...")
+    try:
+        preview = collect_garbage(minecraft_dir, dry_run=True, store_dir=store_dir)
+    except Exception as e:
+        print(f"Failed to scan for unused files: {e}")
+        return
+
+    if not preview["files"] and not preview["store_files"]:
+        print("Nothing to clean up.\n")
+        return
+
+    print(f"Found {preview['files']} unused file(s) ({_mib(preview['bytes'])} MiB)"
+          + (f" and {preview['store_files']} unused shared store file(s)" if preview["store_files"] else "")
+          + f", about {_mib(preview['reclaimed'])} MiB reclaimable.")
+
+    if not questionary.confirm("Delete them?", default=False).ask():
+        print("\nCleanup aborted.\n")
+        return
+
+    result = collect_garbage(minecraft_dir, store_dir=store_dir)
+    print(f"\nRemoved {result['files'] + result['store_files']} file(s), reclaimed {_mib(result['reclaimed'])} MiB.")
+    if result["failed"]:
+        print(f"{result['failed']} file(s) could not be removed.")
+    print()
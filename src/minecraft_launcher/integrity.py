@@ -0,0 +1,111 @@
+import os
+import mmap
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from .config_store import CACHE_DIR, load_config, edit_config
+from .downloader import DEFAULT_WORKERS, _library_tasks, _client_tasks, load_version_json, download_all
+from .asset_store import get_store_dir, store_path
+
+HASH_CACHE_FILE = os.path.join(CACHE_DIR, "hash_cache.json")
+
+
+def _hash_file(path: str) -> str:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha1(b"").hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha1(mapped).hexdigest()
+
+
+def _version_chain_tasks(version_id: str, minecraft_dir: str) -> list:
+    tasks = []
+    seen = set()
+
+    while version_id and version_id not in seen:
+        seen.add(version_id)
+        version_data = load_version_json(version_id, minecraft_dir)
+        tasks.extend(_library_tasks(version_data, minecraft_dir))
+        tasks.extend(_client_tasks(version_id, version_data, minecraft_dir))
+        version_id = version_data.get("inheritsFrom")
+
+    unique = {}
+    for task in tasks:
+        if task.get("sha1") or task.get("size") is not None:
+            unique.setdefault(os.path.abspath(task["path"]), task)
+    return list(unique.values())
+
+
+def _evict_from_store(store_dir: str, task: dict):
+    if not store_dir or not task.get("sha1") or not os.path.exists(task["path"]):
+        return
+    stored = store_path(store_dir, task["sha1"])
+    try:
+        if os.path.samefile(stored, task["path"]):
+            os.remove(stored)
+    except OSError:
+        pass
+
+
+def verify_version(version_id: str, minecraft_dir: str, repair: bool = True,
+                   max_workers: int = DEFAULT_WORKERS) -> dict:
+    tasks = _version_chain_tasks(version_id, minecraft_dir)
+    cache = load_config(HASH_CACHE_FILE)
+    result = {"checked": len(tasks), "hashed": 0, "missing": [], "corrupt": [], "repaired": 0, "failed": []}
+
+    to_hash = []
+    stats = {}
+    for task in tasks:
+        path = os.path.abspath(task["path"])
+        try:
+            st = os.stat(path)
+        except OSError:
+            result["missing"].append(task)
+            continue
+
+        if task.get("size") is not None and st.st_size != task["size"]:
+            result["corrupt"].append(task)
+            continue
+        if not task.get("sha1"):
+            continue
+
+        stats[path] = [st.st_size, st.st_mtime_ns]
+        cached = cache.get(path)
+        if cached and cached[:2] == stats[path]:
+            if cached[2] != task["sha1"]:
+                result["corrupt"].append(task)
+            continue
+        to_hash.append(task)
+
+    hashes = {}
+    if to_hash:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            paths = [os.path.abspath(t["path"]) for t in to_hash]
+            for task, path, digest in zip(to_hash, paths, pool.map(_hash_file, paths)):
+                hashes[path] = stats[path] + [digest]
+                if digest != task["sha1"]:
+                    result["corrupt"].append(task)
+        result["hashed"] = len(to_hash)
+
+    broken = result["missing"] + result["corrupt"]
+    if broken and repair:
+        store_dir = get_store_dir()
+        for task in result["corrupt"]:
+            _evict_from_store(store_dir, task)
+
+        download = download_all(broken, desc=f"Repairing {version_id}", store_dir=store_dir, force=True)
+        failed_paths = {path for path, _ in download["failed"]}
+        result["failed"] = download["failed"]
+        result["repaired"] = len(broken) - len(failed_paths)
+
+        for task in broken:
+            path = os.path.abspath(task["path"])
+            if task["path"] in failed_paths or not task.get("sha1"):
+                continue
+            st = os.stat(path)
+            hashes[path] = [st.st_size, st.st_mtime_ns, task["sha1"]]
+
+    if hashes:
+        with edit_config(HASH_CACHE_FILE) as stored:
+            stored.update(hashes)
+
+    return result
@@ -0,0 +1,176 @@
+import os
+import re
+import glob
+import platform
+import subprocess
+from .config_store import CACHE_DIR, load_config, edit_config, get_value
+from .jvm_tuning import java_major_for_version
+
+RUNTIME_CACHE_FILE = os.path.join(CACHE_DIR, "java_runtimes.json")
+SYSTEM_JVM_GLOBS = [
+    "/usr/lib/jvm/*",
+    "/usr/java/*",
+    "/opt/java/*",
+    "/Library/Java/JavaVirtualMachines/*/Contents/Home",
+    "C:\\Program Files\\Java\\*",
+    "C:\\Program Files\\Eclipse Adoptium\\*",
+]
+PROBE_TIMEOUT = 10
+
+_RELEASE_RE = re.compile(r'^(\w+)="?(.*?)"?$')
+_PROPERTY_RE = re.compile(r"^\s*(java\.version|os\.arch) = (.+)$", re.MULTILINE)
+_ARCH_ALIASES = {"amd64": "x86_64", "x64": "x86_64", "arm64": "aarch64"}
+
+
+def _java_executable(home: str) -> str:
+    name = "javaw.exe" if os.name == "nt" else "java"
+    return os.path.join(home, "bin", name)
+
+
+def _normalize_arch(arch: str) -> str:
+    arch = (arch or "").lower()
+    return _ARCH_ALIASES.get(arch, arch)
+
+
+def host_arch() -> str:
+    return _normalize_arch(platform.machine())
+
+
+def parse_java_major(version: str):
+    match = re.match(r"^(\d+)(?:\.(\d+))?", version or "")
+    if not match:
+        return None
+    major = int(match.group(1))
+    if major == 1 and match.group(2):
+        return int(match.group(2))
+    return major
+
+
+def _read_release(path: str) -> dict:
+    values = {}
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            match = _RELEASE_RE.match(line.strip())
+            if match:
+                values[match.group(1)] = match.group(2)
+    return {"version": values.get("JAVA_VERSION"), "arch": _normalize_arch(values.get("OS_ARCH"))}
+
+
+def _probe_executable(executable: str) -> dict:
+    completed = subprocess.run(
+        [executable, "-XshowSettings:properties", "-version"],
+        capture_output=True,
+        text=True,
+        timeout=PROBE_TIMEOUT
+    )
+    properties = dict(_PROPERTY_RE.findall(completed.stderr))
+    return {"version": properties.get("java.version"), "arch": _normalize_arch(properties.get("os.arch"))}
+
+
+def candidate_homes(minecraft_dir: str = None) -> list:
+    homes = []
+
+    if minecraft_dir:
+        runtime_dir = os.path.join(minecraft_dir, "runtime")
+        homes.extend(
+            os.path.dirname(os.path.dirname(java))
+            for java in glob.glob(os.path.join(runtime_dir, "*", "*", "*", "bin", os.path.basename(_java_executable(""))))
+        )
+
+    java_home = os.environ.get("JAVA_HOME")
+    if java_home:
+        homes.append(java_home)
+
+    for extra in get_value("java_search_paths", []):
+        homes.extend(glob.glob(os.path.expanduser(extra)))
+
+    for pattern in SYSTEM_JVM_GLOBS:
+        homes.extend(glob.glob(pattern))
+
+    unique = {}
+    for home in homes:
+        home = os.path.realpath(home)
+        if os.path.isfile(_java_executable(home)):
+            unique.setdefault(home, None)
+    return list(unique)
+
+
+def _signature(home: str) -> list:
+    release = os.path.join(home, "release")
+    target = release if os.path.isfile(release) else _java_executable(home)
+    st = os.stat(target)
+    return [target, st.st_mtime_ns, st.st_size]
+
+
+def discover_runtimes(minecraft_dir: str = None) -> list:
+    cache = load_config(RUNTIME_CACHE_FILE)
+    bundled_root = os.path.join(os.path.realpath(os.path.join(minecraft_dir, "runtime")), "") if minecraft_dir else None
+    runtimes = {}
+    changed = False
+
+    for home in candidate_homes(minecraft_dir):
+        try:
+            signature = _signature(home)
+        except OSError:
+            continue
+
+        cached = cache.get(home)
+        if cached and cached.get("signature") == signature:
+            runtimes[home] = cached
+            continue
+
+        try:
+            if signature[0].endswith("release"):
+                info = _read_release(signature[0])
+            else:
+                info = _probe_executable(_java_executable(home))
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"Failed to inspect Java runtime at {home}: {e}")
+            continue
+
+        runtimes[home] = {
+            "home": home,
+            "executable": _java_executable(home),
+            "version": info["version"],
+            "major": parse_java_major(info["version"]),
+            "arch": info["arch"] or host_arch(),
+            "bundled": bool(bundled_root) and home.startswith(bundled_root),
+            "signature": signature,
+        }
+        changed = True
+
+    if changed or set(runtimes) != set(cache):
+        with edit_config(RUNTIME_CACHE_FILE) as stored:
+            stored.clear()
+            stored.update(runtimes)
+
+    return [r for r in runtimes.values() if r.get("major")]
+
+
+def select_runtime(required_major: int, runtimes: list):
+    arch = host_arch()
+    usable = [r for r in runtimes if r["major"] >= required_major and r["arch"] in (arch, "")]
+    if not usable:
+        return None
+    return min(usable, key=lambda r: (r["major"] != required_major, r["major"], not r["bundled"], r["home"]))
+
+
+def runtime_for_version(version_id: str, minecraft_dir: str):
+    required = java_major_for_version(version_id, minecraft_dir)
+    return required, select_runtime(required, discover_runtimes(minecraft_dir))
+
+
+def warm_runtime(runtime: dict):
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    for relative in (("lib", "modules"), ("lib", "rt.jar"), ("jre", "lib", "rt.jar")):
+        path = os.path.join(runtime["home"], *relative)
+        if not os.path.isfile(path):
+            continue
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+        return
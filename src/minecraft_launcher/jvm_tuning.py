@@ -0,0 +1,164 @@
+import os
+import re
+import json
+
+PRESETS = {
+    "balanced": "G1, heap sized to host memory, pre-touched when it fits in half of host memory",
+    "low-latency": "ZGC on Java 17+ (generational on 21+), G1 on older runtimes",
+    "low-memory": "Small G1 heap for hosts with little free memory",
+}
+DEFAULT_PRESET = "balanced"
+DEFAULT_JAVA_MAJOR = 8
+MIN_HEAP_MB = 1024
+RESERVED_HOST_MB = 1536
+
+_HEAP_RULES = {
+    "balanced": (0.25, 2048, 8192),
+    "low-latency": (0.30, 2048, 10240),
+    "low-memory": (0.15, 1024, 3072),
+}
+_RAM_RE = re.compile(r"^(\d+)([GM])$", re.IGNORECASE)
+
+
+def validate_ram(ram: str):
+    if ram.strip().lower() == "auto":
+        return True
+    match = _RAM_RE.match(ram.strip())
+    if not match:
+        return "Invalid format. Use e.g., 4G, 4096M or auto."
+    if parse_ram_mb(ram) < MIN_HEAP_MB:
+        return f"Minimum RAM is {MIN_HEAP_MB // 1024}G."
+    return True
+
+
+def parse_ram_mb(ram: str) -> int:
+    value, unit = _RAM_RE.match(ram.strip()).groups()
+    return int(value) * 1024 if unit.upper() == "G" else int(value)
+
+
+def _read_meminfo() -> dict:
+    values = {}
+    try:
+        with open("/proc/meminfo", "r", encoding="utf-8") as f:
+            for line in f:
+                key, _, rest = line.partition(":")
+                values[key] = int(rest.split()[0]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return values
+
+
+def host_resources() -> dict:
+    meminfo = _read_meminfo()
+    total_mb = meminfo.get("MemTotal")
+    if total_mb is None:
+        try:
+            total_mb = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+        except (AttributeError, ValueError, OSError):
+            total_mb = 8192
+
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    return {
+        "memory_total_mb": total_mb,
+        "cpus": cpus,
+    }
+
+
+def java_major_for_version(version_id: str, minecraft_dir: str) -> int:
+    seen = set()
+    while version_id and version_id not in seen:
+        seen.add(version_id)
+        json_path = os.path.join(minecraft_dir, "versions", version_id, f"{version_id}.json")
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            break
+        major = (data.get("javaVersion") or {}).get("majorVersion")
+        if major:
+            return int(major)
+        version_id = data.get("inheritsFrom")
+    return DEFAULT_JAVA_MAJOR
+
+
+def auto_heap_mb(preset: str, resources: dict) -> int:
+    share, low, high = _HEAP_RULES[preset]
+    total = resources["memory_total_mb"]
+    heap = min(max(int(total * share), low), high)
+    heap = min(heap, total - RESERVED_HOST_MB)
+    return max(heap - heap % 256, MIN_HEAP_MB)
+
+
+def _gc_threads(cpus: int) -> tuple:
+    parallel = cpus if cpus <= 8 else 8 + (cpus - 8) * 5 // 8
+    return parallel, max(1, (parallel + 2) // 4)
+
+
+def _g1_flags(heap_mb: int) -> list:
+    large = heap_mb >= 12288
+    region = "16M" if large else "8M" if heap_mb >= 4096 else "4M"
+    return [
+        "-XX:+UseG1GC",
+        "-XX:+ParallelRefProcEnabled",
+        "-XX:MaxGCPauseMillis=200",
+        "-XX:+UnlockExperimentalVMOptions",
+        "-XX:+DisableExplicitGC",
+        f"-XX:G1NewSizePercent={40 if large else 30}",
+        f"-XX:G1MaxNewSizePercent={50 if large else 40}",
+        f"-XX:G1HeapRegionSize={region}",
+        f"-XX:G1ReservePercent={15 if large else 20}",
+        "-XX:G1HeapWastePercent=5",
+        "-XX:G1MixedGCCountTarget=4",
+        f"-XX:InitiatingHeapOccupancyPercent={20 if large else 15}",
+        "-XX:G1MixedGCLiveThresholdPercent=90",
+        "-XX:SurvivorRatio=32",
+        "-XX:MaxTenuringThreshold=1",
+    ]
+
+
+def _zgc_flags(java_major: int) -> list:
+    flags = ["-XX:+UseZGC"]
+    if 21 <= java_major < 23:
+        flags.append("-XX:+ZGenerational")
+    return flags
+
+
+def build_jvm_arguments(preset: str = DEFAULT_PRESET, ram: str = "auto", java_major: int = DEFAULT_JAVA_MAJOR,
+                        resources: dict = None) -> list:
+    if preset not in PRESETS:
+        raise ValueError(f"Unknown JVM preset '{preset}'. Choose one of: {', '.join(PRESETS)}")
+
+    resources = resources or host_resources()
+    heap_mb = auto_heap_mb(preset, resources) if not ram or ram.lower() == "auto" else parse_ram_mb(ram)
+    pre_touch = preset != "low-memory" and heap_mb <= resources["memory_total_mb"] // 2
+    initial_mb = heap_mb if preset != "low-memory" else min(heap_mb, 512)
+    parallel, concurrent = _gc_threads(resources["cpus"])
+
+    args = [f"-Xms{initial_mb}M", f"-Xmx{heap_mb}M"]
+    if preset == "low-latency" and java_major >= 17:
+        args += _zgc_flags(java_major)
+    else:
+        args += _g1_flags(heap_mb)
+        if preset == "low-memory":
+            args.append("-XX:+UseStringDeduplication")
+
+    args += [
+        f"-XX:ParallelGCThreads={parallel}",
+        f"-XX:ConcGCThreads={concurrent}",
+        "-XX:+AlwaysPreTouch" if pre_touch else "-XX:-AlwaysPreTouch",
+        "-XX:+PerfDisableSharedMem",
+    ]
+    return args
+
+
+def profile_jvm_arguments(profile: dict, version_id: str, minecraft_dir: str, java_major: int = None) -> list:
+    preset = profile.get("jvmPreset")
+    if not preset:
+        return profile.get("jvmArguments", build_jvm_arguments())
+
+    java_major = java_major or java_major_for_version(version_id, minecraft_dir)
+    return build_jvm_arguments(preset, profile.get("ramAmount", "auto"), java_major) + profile.get("jvmArguments", [])
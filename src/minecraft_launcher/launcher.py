@@ -1,130 +1,189 @@
 import os
 import json
-import sys
-import subprocess
-import minecraft_launcher_lib
+import time
 from .selector import select_version
 from .config_wizard import run_setup_wizard
-from .installer import install_version
 from .profile_applier import apply_profile
-from .install_wizard import run_install_wizard
 from .update_pack_formats import update_skin_pack_formats
+from .command_cache import get_minecraft_command
+from .config_store import CONFIG_FILE, get_value, set_value
+from .process_supervisor import start_instance
+from .version_index import mark_played
+from .integrity import verify_version
+from .jvm_tuning import profile_jvm_arguments
+from .java_runtimes import runtime_for_version, warm_runtime
+from .path_manager import MINECRAFT_DIR_ENV_VAR
+
+CONFIG_DIRECTORY = os.path.abspath("min_configs")
 
 
 def get_minecraft_dir():
-    config_path = os.path.abspath("launcher_config.json")
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
-                dir_path = config.get("minecraft_dir")
-                if dir_path and os.path.exists(dir_path):
-                    return dir_path
-        except Exception:
-            pass
+    override = os.environ.get(MINECRAFT_DIR_ENV_VAR)
+    if override:
+        os.makedirs(override, exist_ok=True)
+        return os.path.abspath(override)
+
+    dir_path = get_value("minecraft_dir")
+    if dir_path and os.path.exists(dir_path):
+        return dir_path
     default_dir = os.path.abspath("min_dir")
     if not os.path.exists(default_dir):
         os.makedirs(default_dir, exist_ok=True)
     return default_dir
 
 
-def run_launcher():
-    minecraft_directory = get_minecraft_dir()
-    config_directory = os.path.abspath("min_configs")
+def load_profile(selected_config: str) -> dict:
+    config_path = os.path.join(CONFIG_DIRECTORY, selected_config)
+    with open(config_path, "r", encoding="utf-8") as f:
+        return json.load(f)
 
-    print("\n[Launcher] Starting Minecraft Launcher\n")
 
-    if not os.path.exists(minecraft_directory):
-        print(f"Minecraft directory not found at {minecraft_directory}. Creating it...")
-        os.makedirs(minecraft_directory, exist_ok=True)
+def _verify_files(selected_version: str, minecraft_directory: str):
+    result = verify_version(selected_version, minecraft_directory)
+    broken = len(result["missing"]) + len(result["corrupt"])
 
-    selected_version = select_version("installed")
-    if not selected_version:
-        print("\nNo installed versions found. Running setup and installation...\n")
-        install_info = run_install_wizard()
-        install_version(install_info)
-        selected_version = select_version("installed")
-        if not selected_version:
-            print("Installation failed or no version was installed.")
-            return
+    if broken:
+        print(f"Game files: {len(result['missing'])} missing, {len(result['corrupt'])} corrupt, "
+              f"{result['repaired']} repaired.")
+    for path, error in result["failed"]:
+        print(f"Could not repair {path}: {error}")
 
-    if selected_version == "Back":
-        return
 
-    selected_config = select_version("config")
-    if selected_config == "Back":
-        return
+def _select_java(profile: dict, selected_version: str, minecraft_directory: str) -> dict:
+    if profile.get("javaPath"):
+        return {"executable": profile["javaPath"], "major": None, "description": profile["javaPath"]}
 
-    if not selected_config:
-        print("\nNo configuration found. Running setup wizard...\n")
-        config = run_setup_wizard()
-        selected_config = apply_profile(config)
-        print(f"New config created: {selected_config}")
+    try:
+        required, runtime = runtime_for_version(selected_version, minecraft_directory)
+    except Exception as e:
+        print(f"Failed to discover Java runtimes: {e}")
+        return {"major": None, "description": "default"}
 
-    config_path = os.path.join(config_directory, selected_config)
+    if runtime is None:
+        print(f"No installed Java {required}+ runtime found, using the default Java.")
+        return {"major": required, "description": "default"}
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            profile = json.load(f)
-    except Exception as e:
-        print(f"Failed to load config '{selected_config}': {e}")
-        return
+        warm_runtime(runtime)
+    except OSError:
+        pass
+    return dict(runtime, description=f"{runtime['version']} ({runtime['home']})")
+
+
+def launch_version(selected_version: str, selected_config: str, profile: dict, minecraft_directory: str) -> dict:
+    java = _select_java(profile, selected_version, minecraft_directory)
 
     options = {
         "username": profile.get("username", "Player"),
         "uuid": profile.get("uuid", "00000000-0000-0000-0000-000000000000"),
         "token": profile.get("token", ""),
-        "jvmArguments": profile.get("jvmArguments", ["-Xms4G", "-Xmx4G"]),
+        "jvmArguments": profile_jvm_arguments(profile, selected_version, minecraft_directory, java["major"]),
         "disableMultiplayer": profile.get("disableMultiplayer", False),
         "disableChat": profile.get("disableChat", False),
     }
+    if java.get("executable"):
+        options["executablePath"] = java["executable"]
 
     print("\n[Launcher Summary]")
     print(f" - Minecraft directory: {minecraft_directory}")
     print(f" - Selected version: {selected_version}")
-    print(f" - Using config: {selected_config}\n")
+    print(f" - Using config: {selected_config}")
+    print(f" - Java: {java['description']}")
+    print(f" - JVM: {profile.get('jvmPreset') or 'custom arguments'} "
+          f"({next((a[4:] for a in options['jvmArguments'] if a.startswith('-Xmx')), 'default')} heap)\n")
 
+    timings = {}
+    started = time.perf_counter()
     try:
         pack_format_map_path = os.path.abspath("resourcepack_pack_format.json")
-        launcher_config_path = os.path.abspath("launcher_config.json")
 
         update_skin_pack_formats(
             minecraft_dir=minecraft_directory,
             current_version=selected_version,
             pack_format_map_path=pack_format_map_path,
-            launcher_config_path=launcher_config_path
+            launcher_config_path=CONFIG_FILE
         )
     except Exception as e:
         print(f"Failed to update resource pack formats: {e}")
+    timings["pack_update"] = time.perf_counter() - started
+
+    if get_value("verify_before_launch", True):
+        started = time.perf_counter()
+        try:
+            _verify_files(selected_version, minecraft_directory)
+        except Exception as e:
+            print(f"Failed to verify game files: {e}")
+        timings["verify"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    minecraft_command = get_minecraft_command(selected_version, minecraft_directory, options)
+    timings["command"] = time.perf_counter() - started
+
+    print("Launching Minecraft... please wait.\n")
+    started = time.perf_counter()
+    instance = start_instance(
+        minecraft_command,
+        cwd=os.path.abspath("."),
+        version=selected_version,
+        profile=selected_config
+    )
+    timings["spawn"] = time.perf_counter() - started
+    instance["timings"] = timings
+
+    print(f"Minecraft started (PID {instance['pid']}).")
+    print(f"Game output is written to: {instance['log_path']}")
 
     try:
-        minecraft_command = minecraft_launcher_lib.command.get_minecraft_command(
-            version=selected_version,
-            minecraft_directory=minecraft_directory,
-            options=options
-        )
+        set_value("recently_played", selected_version)
+        mark_played(minecraft_directory, selected_version)
+        print(f"Saved recently played version: {selected_version}")
+    except Exception as e:
+        print(f"Failed to save recently played version: {e}")
 
-        print("Launching Minecraft... please wait.\n")
-        completed = subprocess.run(minecraft_command, cwd=os.path.abspath("."))
+    return instance
 
-        if completed.returncode != 0:
-            print(f"Minecraft exited with a non-zero code: {completed.returncode}")
-            sys.exit(completed.returncode)
 
-        print("\nMinecraft exited successfully!")
+def run_launcher():
+    minecraft_directory = get_minecraft_dir()
 
-        try:
-            launcher_config_path = os.path.abspath("launcher_config.json")
-            config_data = {}
-            if os.path.exists(launcher_config_path):
-                with open(launcher_config_path, "r", encoding="utf-8") as f:
-                    config_data = json.load(f)
-            config_data["recently_played"] = selected_version
-            with open(launcher_config_path, "w", encoding="utf-8") as f:
-                json.dump(config_data, f, indent=2)
-            print(f"Saved recently played version: {selected_version}")
-        except Exception as e:
-            print(f"Failed to save recently played version: {e}")
+    print("\n[Launcher] Starting Minecraft Launcher\n")
+
+    if not os.path.exists(minecraft_directory):
+        print(f"Minecraft directory not found at {minecraft_directory}. Creating it...")
+        os.makedirs(minecraft_directory, exist_ok=True)
+
+    selected_version = select_version("installed")
+    if not selected_version:
+        print("\nNo installed versions found. Running setup and installation...\n")
+        from .install_wizard import run_install_wizard
+        from .installer import install_version
+        install_info = run_install_wizard()
+        install_version(install_info)
+        selected_version = select_version("installed")
+        if not selected_version:
+            print("Installation failed or no version was installed.")
+            return
 
+    if selected_version == "Back":
+        return
+
+    selected_config = select_version("config")
+    if selected_config == "Back":
+        return
+
+    if not selected_config:
+        print("\nNo configuration found. Running setup wizard...\n")
+        config = run_setup_wizard()
+        selected_config = apply_profile(config)
+        print(f"New config created: {selected_config}")
+
+    try:
+        profile = load_profile(selected_config)
+    except Exception as e:
+        print(f"Failed to load config '{selected_config}': {e}")
+        return
+
+    try:
+        launch_version(selected_version, selected_config, profile, minecraft_directory)
     except Exception as e:
         print(f"Failed to launch Minecraft: {e}")
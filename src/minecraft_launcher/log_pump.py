@@ -0,0 +1,53 @@
+import sys
+import signal
+import subprocess
+from .game_logs import start_capture, finish_capture, record_crash
+
+
+def _record_spawn_failure(log_path: str, version: str, profile: str, error: OSError) -> int:
+    returncode = 127 if isinstance(error, FileNotFoundError) else 126
+    message = f"Failed to start game: {error}"
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write(message + "\n")
+    record_crash(version, profile, returncode, [message], log_path)
+    return returncode
+
+
+def run_pump(log_path: str, version: str, profile: str, cwd: str, command: list) -> int:
+    try:
+        process = subprocess.Popen(
+            command,
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+    except OSError as e:
+        return _record_spawn_failure(log_path, version, profile, e)
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, lambda *_: process.terminate())
+
+    capture = start_capture(process, log_path)
+    finish_capture(capture)
+    returncode = process.wait()
+
+    if returncode != 0:
+        try:
+            record_crash(version, profile, returncode, capture["buffer"], log_path)
+        except Exception as e:
+            print(f"Failed to record crash: {e}", file=sys.stderr)
+    return returncode
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    log_path, version, profile, cwd, separator, *command = argv
+    if separator != "--" or not command:
+        raise SystemExit("usage: log_pump LOG_PATH VERSION PROFILE CWD -- COMMAND...")
+
+    returncode = run_pump(log_path, version, profile, cwd, command)
+    sys.exit(returncode if returncode >= 0 else 128 - returncode)
+
+
+if __name__ == "__main__":
+    main()
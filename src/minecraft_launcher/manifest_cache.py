@@ -0,0 +1,132 @@
+import os
+import json
+import time
+import threading
+import urllib.request
+import urllib.error
+from .config_store import CACHE_DIR, load_config
+
+VERSION_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
+MANIFEST_CACHE_FILE = os.path.join(CACHE_DIR, "version_manifest.json")
+OFFLINE_ENV_VAR = "MINECRAFT_LAUNCHER_OFFLINE"
+DEFAULT_TTL = 3600
+DEFAULT_TIMEOUT = 3
+COLD_TIMEOUT = 30
+USER_AGENT = "minecraft-launcher"
+
+_memory_entry = None
+_fetch_lock = threading.RLock()
+
+
+def _settings():
+    config = load_config()
+    offline = os.environ.get(OFFLINE_ENV_VAR, "") not in ("", "0") or bool(config.get("manifest_offline", False))
+    return (
+        config.get("manifest_cache_ttl", DEFAULT_TTL),
+        offline,
+        config.get("manifest_timeout", DEFAULT_TIMEOUT),
+    )
+
+
+def _load_cache():
+    global _memory_entry
+    if _memory_entry is not None:
+        return _memory_entry
+
+    if not os.path.exists(MANIFEST_CACHE_FILE):
+        return None
+
+    try:
+        with open(MANIFEST_CACHE_FILE, "r", encoding="utf-8") as f:
+            _memory_entry = json.load(f)
+    except Exception:
+        return None
+    return _memory_entry
+
+
+def _save_cache(entry: dict):
+    global _memory_entry
+    _memory_entry = entry
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f"{MANIFEST_CACHE_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, MANIFEST_CACHE_FILE)
+    except Exception as e:
+        print(f"Failed to write version manifest cache: {e}")
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def get_version_manifest(url: str = VERSION_MANIFEST_URL, ttl: int = None, offline: bool = None,
+                         timeout: float = None) -> dict:
+    with _fetch_lock:
+        return _get_version_manifest(url, ttl, offline, timeout)
+
+
+def _get_version_manifest(url: str, ttl: int, offline: bool, timeout: float) -> dict:
+    default_ttl, default_offline, default_timeout = _settings()
+    ttl = default_ttl if ttl is None else ttl
+    offline = default_offline if offline is None else offline
+    timeout = default_timeout if timeout is None else timeout
+
+    entry = _load_cache()
+    if entry and entry.get("url") != url:
+        entry = None
+
+    if entry and (offline or time.time() - entry.get("fetched_at", 0) < ttl):
+        return entry["data"]
+
+    if offline:
+        raise RuntimeError("Offline mode is enabled and no cached version manifest is available.")
+
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    if entry and entry.get("etag"):
+        request.add_header("If-None-Match", entry["etag"])
+    if entry and entry.get("last_modified"):
+        request.add_header("If-Modified-Since", entry["last_modified"])
+
+    try:
+        with urllib.request.urlopen(request, timeout=timeout if entry else COLD_TIMEOUT) as response:
+            data = json.loads(response.read().decode("utf-8"))
+            entry = {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+                "data": data,
+            }
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or not entry:
+            if entry:
+                print(f"Version manifest request failed ({e.code}), using cached version list.")
+                return entry["data"]
+            raise
+        entry = dict(entry, fetched_at=time.time())
+    except (urllib.error.URLError, OSError) as e:
+        if not entry:
+            raise
+        print(f"Network unavailable ({e}), using cached version list.")
+        return entry["data"]
+
+    _save_cache(entry)
+    return entry["data"]
+
+
+def get_version_list(**kwargs) -> list:
+    return [
+        {
+            "id": v["id"],
+            "type": v["type"],
+            "releaseTime": v.get("releaseTime"),
+            "complianceLevel": v.get("complianceLevel", 0),
+        }
+        for v in get_version_manifest(**kwargs).get("versions", [])
+    ]
+
+
+def get_latest_version(**kwargs) -> dict:
+    return get_version_manifest(**kwargs)["latest"]
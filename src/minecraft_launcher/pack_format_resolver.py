@@ -0,0 +1,127 @@
+import os
+import re
+import json
+import pickle
+from bisect import bisect_right
+from .config_store import CACHE_DIR
+
+RESOLVER_CACHE_FILE = os.path.join(CACHE_DIR, "pack_formats.pickle")
+RESOLVER_CACHE_VERSION = 1
+DEFAULT_PACK_FORMAT = 18
+
+_RELEASE_RE = re.compile(
+    r"^(\d+)\.(\d+)(?:\.(\d+))?(?:[- ](snapshot|pre-release|pre|rc)[- ]?(\d+))?$",
+    re.IGNORECASE
+)
+_SNAPSHOT_RE = re.compile(r"^(\d{2})w(\d{2})([a-z]+)$", re.IGNORECASE)
+_STAGES = {"snapshot": 0, "pre-release": 1, "pre": 1, "rc": 2, None: 3}
+
+_LOADER_PATTERNS = [
+    (re.compile(r"^(?:fabric|quilt)-loader-[^-]+-(.+)$", re.IGNORECASE), lambda m: m.group(1)),
+    (re.compile(r"^neoforge-(\d+)\.(\d+)\.", re.IGNORECASE),
+     lambda m: f"1.{m.group(1)}" + (f".{m.group(2)}" if m.group(2) != "0" else "")),
+    (re.compile(r"^(.+?)-(?:neoforge|forge|optifine)", re.IGNORECASE), lambda m: m.group(1)),
+]
+
+_memory = {}
+
+
+def strip_modloader(version_id: str) -> str:
+    for pattern, extract in _LOADER_PATTERNS:
+        match = pattern.match(version_id)
+        if match:
+            return extract(match)
+    return version_id
+
+
+def version_key(version_id: str):
+    base = strip_modloader(version_id.strip())
+
+    match = _RELEASE_RE.match(base)
+    if match:
+        major, minor, patch, stage, number = match.groups()
+        stage = stage.lower() if stage else None
+        return "release", (int(major), int(minor), int(patch or 0), _STAGES[stage], int(number or 0))
+
+    match = _SNAPSHOT_RE.match(base)
+    if match:
+        year, week, suffix = match.groups()
+        return "snapshot", (int(year), int(week), suffix.lower())
+
+    return None
+
+
+def _source_signature(path: str):
+    st = os.stat(path)
+    return [os.path.abspath(path), st.st_mtime_ns, st.st_size]
+
+
+def compile_index(pack_format_map_path: str) -> dict:
+    with open(pack_format_map_path, "r", encoding="utf-8") as f:
+        version_to_pack = json.load(f)
+
+    entries = {"release": {}, "snapshot": {}}
+    for version_id, pack_format in version_to_pack.items():
+        if version_id.startswith("_"):
+            continue
+        parsed = version_key(version_id)
+        if parsed is None:
+            continue
+        kind, key = parsed
+        entries[kind][key] = int(pack_format)
+
+    index = {"latest": max((f for e in entries.values() for f in e.values()), default=DEFAULT_PACK_FORMAT)}
+    for kind, mapping in entries.items():
+        keys = sorted(mapping)
+        index[kind] = (keys, [mapping[k] for k in keys])
+    return index
+
+
+def load_index(pack_format_map_path: str) -> dict:
+    signature = _source_signature(pack_format_map_path)
+
+    cached = _memory.get(signature[0])
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    index = None
+    if os.path.exists(RESOLVER_CACHE_FILE):
+        try:
+            with open(RESOLVER_CACHE_FILE, "rb") as f:
+                artifact = pickle.load(f)
+            if artifact.get("version") == RESOLVER_CACHE_VERSION and artifact.get("source") == signature:
+                index = artifact["index"]
+        except Exception:
+            index = None
+
+    if index is None:
+        index = compile_index(pack_format_map_path)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{RESOLVER_CACHE_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump({"version": RESOLVER_CACHE_VERSION, "source": signature, "index": index}, f)
+            os.replace(tmp_path, RESOLVER_CACHE_FILE)
+        except Exception as e:
+            print(f"Failed to write pack format cache: {e}")
+
+    _memory[signature[0]] = (signature, index)
+    return index
+
+
+def resolve_pack_format(version_id: str, pack_format_map_path: str):
+    index = load_index(pack_format_map_path)
+
+    parsed = version_key(version_id)
+    if parsed is None:
+        return index["latest"], False
+
+    kind, key = parsed
+    keys, formats = index[kind]
+    if not keys:
+        return index["latest"], False
+
+    position = bisect_right(keys, key) - 1
+    if position < 0:
+        return formats[0], False
+    return formats[position], keys[position] == key
@@ -1,30 +1,20 @@
 import os
 import sys
-import json
-import platform
 import subprocess
-from tkinter import Tk, filedialog
 import questionary
+from .config_store import CONFIG_FILE, load_config, save_config
 
 DEFAULT_MIN_DIR = os.path.abspath("min_dir")
-CONFIG_FILE = os.path.abspath("launcher_config.json")
+MINECRAFT_DIR_ENV_VAR = "MINECRAFT_LAUNCHER_DIR"
 
 
 def load_launcher_config():
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            print("Failed to read launcher_config.json, using empty config.")
-    return {}
+    return load_config(CONFIG_FILE)
 
 
 def save_launcher_config(config: dict):
-    os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        save_config(config, CONFIG_FILE)
         print(f"launcher_config.json updated successfully!")
     except Exception as e:
         print(f"Failed to save launcher configuration: {e}")
@@ -59,6 +49,7 @@ def prompt_minecraft_dir():
         selected_dir = DEFAULT_MIN_DIR
     else:
         print("Please select a folder in the dialog...")
+        from tkinter import Tk, filedialog
         root = Tk()
         root.withdraw()
         selected_dir = filedialog.askdirectory()
@@ -79,6 +70,11 @@ def prompt_minecraft_dir():
 
 
 def get_minecraft_dir():
+    override = os.environ.get(MINECRAFT_DIR_ENV_VAR)
+    if override:
+        os.makedirs(override, exist_ok=True)
+        return os.path.abspath(override)
+
     config = load_launcher_config()
     saved_dir = config.get("minecraft_dir")
 
@@ -0,0 +1,169 @@
+import os
+import re
+import sys
+import time
+import uuid
+import signal
+import shutil
+import threading
+import subprocess
+import questionary
+from questionary import Separator
+from .game_logs import LOG_DIR, find_crash, show_recent_crashes
+
+STOP_TIMEOUT = 10
+
+_instances = {}
+_lock = threading.Lock()
+
+
+def _safe_name(value: str) -> str:
+    return re.sub(r"[^\w.\-]", "_", value)
+
+
+def _watch(instance: dict, on_exit):
+    returncode = instance["process"].wait()
+    with _lock:
+        instance["returncode"] = returncode
+        instance["ended_at"] = time.time()
+
+    if returncode != 0:
+        instance["crash"] = find_crash(instance["version"], instance["profile"], instance["log_path"])
+    if on_exit:
+        try:
+            on_exit(instance)
+        except Exception:
+            pass
+
+
+def start_instance(command: list, cwd: str, version: str, profile: str, on_exit=None) -> dict:
+    os.makedirs(LOG_DIR, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    profile_name = os.path.splitext(os.path.basename(profile))[0]
+    log_path = os.path.join(LOG_DIR, f"{_safe_name(version)}_{_safe_name(profile_name)}_{stamp}_{uuid.uuid4().hex[:8]}.log")
+
+    if not shutil.which(command[0]):
+        raise FileNotFoundError(f"Java executable not found: {command[0]}")
+    if not os.path.isdir(cwd):
+        raise FileNotFoundError(f"Game directory not found: {cwd}")
+
+    popen_kwargs = {}
+    if os.name == "nt":
+        popen_kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        popen_kwargs["start_new_session"] = True
+
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in (package_root, os.environ.get("PYTHONPATH")) if p))
+
+    process = subprocess.Popen(
+        [sys.executable, "-m", "minecraft_launcher.log_pump", log_path, version, os.path.basename(profile), cwd, "--", *command],
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **popen_kwargs
+    )
+
+    instance = {
+        "pid": process.pid,
+        "version": version,
+        "profile": os.path.basename(profile),
+        "log_path": log_path,
+        "started_at": time.time(),
+        "ended_at": None,
+        "returncode": None,
+        "process": process,
+    }
+
+    with _lock:
+        _instances[process.pid] = instance
+
+    instance["watcher"] = threading.Thread(target=_watch, args=(instance, on_exit), daemon=True)
+    instance["watcher"].start()
+    return instance
+
+
+def list_instances(running_only: bool = False) -> list:
+    with _lock:
+        instances = sorted(_instances.values(), key=lambda i: i["started_at"])
+    if running_only:
+        return [i for i in instances if i["returncode"] is None]
+    return instances
+
+
+def running_count() -> int:
+    return len(list_instances(running_only=True))
+
+
+def wait_instance(pid: int, timeout: float = None):
+    with _lock:
+        instance = _instances.get(pid)
+    if not instance:
+        return None
+
+    instance["watcher"].join(timeout)
+    return instance["returncode"]
+
+
+def _signal_group(process, force: bool = False):
+    if os.name == "nt":
+        subprocess.run(["taskkill", "/T", *(["/F"] if force else []), "/PID", str(process.pid)], capture_output=True)
+        return
+    try:
+        os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+
+
+def stop_instance(pid: int, timeout: int = STOP_TIMEOUT) -> bool:
+    with _lock:
+        instance = _instances.get(pid)
+    if not instance or instance["returncode"] is not None:
+        return False
+
+    process = instance["process"]
+    _signal_group(process)
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _signal_group(process, force=True)
+        process.wait()
+    return True
+
+
+def _describe(instance: dict) -> str:
+    if instance["returncode"] is None:
+        minutes = int((time.time() - instance["started_at"]) // 60)
+        status = f"running {minutes} min"
+    else:
+        status = f"exited with code {instance['returncode']}"
+    return f"PID {instance['pid']} - {instance['version']} ({instance['profile']}) - {status}"
+
+
+def instances_menu():
+    while True:
+        instances = list_instances()
+        if instances:
+            print("\n[Instances]")
+            for instance in instances:
+                print(f" - {_describe(instance)}")
+                print(f"   log: {instance['log_path']}")
+        else:
+            print("\nNo game instances were started in this session.")
+
+        running = [i for i in instances if i["returncode"] is None]
+        choices = [f"Stop PID {i['pid']}" for i in running] + ["Recent crashes", "Refresh", Separator(" "), "Back"]
+
+        action = questionary.select("Instance options:", choices=choices).ask()
+
+        if action == "Back" or not action:
+            return
+
+        elif action == "Recent crashes":
+            show_recent_crashes()
+
+        elif action.startswith("Stop PID"):
+            pid = int(action.split()[-1])
+            if stop_instance(pid):
+                print(f"\nStopped instance {pid}.")
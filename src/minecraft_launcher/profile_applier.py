@@ -3,6 +3,7 @@ import os
 import questionary
 import hashlib
 import uuid
+from .jvm_tuning import DEFAULT_PRESET
 
 
 def get_minecraft_offline_uuid(username: str) -> str:
@@ -13,25 +14,26 @@ def get_minecraft_offline_uuid(username: str) -> str:
     return str(generated_uuid)
 
 
-def apply_profile(config: dict, output_path: str = None):
+def _safe_profile_name(name: str) -> str:
+    return "".join(c for c in name if c.isalnum() or c in (" ", "_", "-")).strip()
+
+
+def apply_profile(config: dict, output_path: str = None, profile_name: str = None):
     username = config.get("username", "Player")
     uuid_value = get_minecraft_offline_uuid(username)
     token = ""
 
-    ram_amount = config.get("ram_amount", "4G").upper()
+    ram_amount = config.get("ram_amount", "auto").strip()
+    ram_amount = "auto" if ram_amount.lower() == "auto" else ram_amount.upper()
     disable_multiplayer = config.get("disable_multiplayer", False)
     disable_chat = config.get("disable_chat", False)
 
-    jvm_args = [
-        "-Xms4G",
-        f"-Xmx{ram_amount}"
-    ]
-
     profile_data = {
         "username": username,
         "uuid": uuid_value,
         "token": token,
-        "jvmArguments": jvm_args,
+        "jvmPreset": config.get("jvm_preset", DEFAULT_PRESET),
+        "ramAmount": ram_amount,
         "disableMultiplayer": disable_multiplayer,
         "disableChat": disable_chat
     }
@@ -39,7 +41,14 @@ def apply_profile(config: dict, output_path: str = None):
     config_dir = os.path.abspath("min_configs")
     os.makedirs(config_dir, exist_ok=True)
 
-    while True:
+    interactive = profile_name is None
+    if not interactive:
+        safe_name = _safe_profile_name(profile_name)
+        if not safe_name:
+            raise ValueError("Invalid profile name. Use letters, numbers, underscores, or hyphens.")
+        output_path = os.path.join(config_dir, f"{safe_name}.json")
+
+    while interactive:
         profile_name = questionary.text(
             "Enter a name for this Minecraft profile (e.g., 'MySurvivalProfile'):",
             default="MyMinecraftProfile"
@@ -49,7 +58,7 @@ def apply_profile(config: dict, output_path: str = None):
             print("Profile name cannot be empty.")
             continue
 
-        safe_name = "".join(c for c in profile_name if c.isalnum() or c in (" ", "_", "-")).strip()
+        safe_name = _safe_profile_name(profile_name)
         if not safe_name:
             print("Invalid profile name. Use letters, numbers, underscores, or hyphens.")
             continue
@@ -67,7 +76,7 @@ def apply_profile(config: dict, output_path: str = None):
                     print(f"Overwriting existing profile '{safe_name}.json'...")
                     break
                 elif confirm:
-                    safe_name = "".join(c for c in confirm if c.isalnum() or c in (" ", "_", "-")).strip()
+                    safe_name = _safe_profile_name(confirm)
                     continue
                 else:
                     continue
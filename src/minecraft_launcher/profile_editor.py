@@ -4,6 +4,11 @@ import re
 import questionary
 from .selector import select_version
 from .profile_applier import get_minecraft_offline_uuid
+from .jvm_tuning import PRESETS, validate_ram
+
+
+def _without_heap_flags(jvm_args):
+    return [arg for arg in jvm_args if not arg.startswith(("-Xms", "-Xmx"))]
 
 
 def update_jvm_ram(jvm_args, ram: str):
@@ -57,20 +62,30 @@ def edit_existing_profile():
         if username:
             break
 
+    old_preset = data.get("jvmPreset")
+    preset_choices = [questionary.Choice(f"{name} - {description}", value=name) for name, description in PRESETS.items()]
+    if not old_preset:
+        preset_choices.append(questionary.Choice("custom - keep the current JVM arguments", value="custom"))
+
+    jvm_preset = questionary.select(
+        "Select JVM tuning preset:",
+        choices=preset_choices,
+        default=old_preset or "custom"
+    ).ask() or old_preset or "custom"
+
+    if jvm_preset == "custom":
+        current_ram = next((arg[4:] for arg in old_jvm if arg.startswith("-Xmx")), "4G")
+    else:
+        current_ram = data.get("ramAmount") or next((arg[4:] for arg in old_jvm if arg.startswith("-Xmx")), "auto")
+
     def _validate_ram(ram: str):
-        if not re.match(r"^\d+[GM]$", ram, re.IGNORECASE):
-            return "Invalid format. Use e.g., 4G or 4096M."
-        value = int(re.match(r"^(\d+)", ram).group(1))
-        if ram.upper().endswith("G") and value < 4:
-            return "Minimum RAM is 4G."
-        if ram.upper().endswith("M") and value < 4096:
-            return "Minimum RAM is 4096M."
-        return True
-
-    current_ram = next((arg[4:] for arg in old_jvm if arg.startswith("-Xmx")), "4G")
+        if jvm_preset == "custom" and ram.strip().lower() == "auto":
+            return "Automatic sizing needs a JVM preset."
+        return validate_ram(ram)
+
     while True:
         ram_amount = questionary.text(
-            "Enter RAM amount (e.g., 4G, 4096M) [Default = 4G]:",
+            "Enter RAM amount (e.g., 4G, 4096M, auto):",
             default=current_ram,
             validate=_validate_ram
         ).ask()
@@ -89,7 +104,16 @@ def edit_existing_profile():
     new_data["username"] = username
     new_data["disableMultiplayer"] = disable_multiplayer
     new_data["disableChat"] = disable_chat
-    new_data["jvmArguments"] = update_jvm_ram(old_jvm, ram_amount)
+    if jvm_preset == "custom":
+        new_data["jvmArguments"] = update_jvm_ram(old_jvm, ram_amount.upper())
+    else:
+        new_data["jvmPreset"] = jvm_preset
+        new_data["ramAmount"] = "auto" if ram_amount.lower() == "auto" else ram_amount.upper()
+        extra_args = old_jvm if old_preset else _without_heap_flags(old_jvm)
+        if extra_args:
+            new_data["jvmArguments"] = extra_args
+        else:
+            new_data.pop("jvmArguments", None)
 
     if username != old_username:
         new_data["uuid"] = get_minecraft_offline_uuid(username)
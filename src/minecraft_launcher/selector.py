@@ -1,34 +1,44 @@
 import questionary
-import minecraft_launcher_lib
 import os
-import json
-import re
 from questionary import Separator
 from .path_manager import get_minecraft_dir
+from .manifest_cache import get_version_list, get_latest_version
+from .config_store import get_value
+from .version_index import get_installed_versions
+from .version_parser import LOADER_LABELS, parse_version, sort_versions
 
-LAUNCHER_CONFIG_PATH = os.path.abspath("launcher_config.json")
+VANILLA_GROUPS = [
+    ("release", "---Releases (newest → oldest)---"),
+    ("pre-release", "---Pre-releases / RCs---"),
+    ("snapshot", "---Snapshots---"),
+]
 
 
 def _load_recent_version():
-    if os.path.exists(LAUNCHER_CONFIG_PATH):
-        try:
-            with open(LAUNCHER_CONFIG_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data.get("recently_played")
-        except Exception:
-            pass
-    return None
+    return get_value("recently_played")
 
 
-def _extract_version_number(vname: str):
-    match = re.search(r"(\d+\.\d+(?:\.\d+)*)", vname)
-    if match:
-        return tuple(int(p) for p in match.group(1).split("."))
-    return (0, 0, 0)
+def _group_versions(installed: list) -> list:
+    groups = {}
+    for entry in installed:
+        parsed = parse_version(entry["id"], entry.get("inheritsFrom"))
+        if parsed.loader:
+            group = parsed.loader
+        elif parsed.kind == "rc":
+            group = "pre-release"
+        else:
+            group = parsed.kind
+        groups.setdefault(group, []).append(parsed)
 
+    ordered = VANILLA_GROUPS + [
+        (loader, f"---Modded versions ({label})---") for loader, label in LOADER_LABELS.items()
+    ] + [("unknown", "---Other versions---")]
 
-def _sort_versions(version_list):
-    return sorted(version_list, key=lambda v: _extract_version_number(v), reverse=True)
+    return [
+        (title, [p.id for p in sort_versions(groups[group])])
+        for group, title in ordered
+        if group in groups
+    ]
 
 
 def select_version(mode: str = "download"):
@@ -73,7 +83,7 @@ def select_version(mode: str = "download"):
     elif mode == "installed":
         minecraft_dir = get_minecraft_dir()
 
-        installed = minecraft_launcher_lib.utils.get_installed_versions(minecraft_dir)
+        installed = get_installed_versions(minecraft_dir)
 
         if not installed:
             print("No installed versions found.")
@@ -88,32 +98,6 @@ def select_version(mode: str = "download"):
 
         recent = _load_recent_version()
 
-        releases = []
-        modded = []
-        snapshots = []
-
-        for v in installed_names:
-            vid = v.lower()
-
-            if "forge" in vid or "fabric" in vid:
-                modded.append(v)
-                continue
-
-            if (
-                re.search(r"\d{2}w\d{2}[a-z]", vid)
-                or "snapshot" in vid
-                or "rc" in vid
-                or "pre" in vid
-            ):
-                snapshots.append(v)
-                continue
-
-            releases.append(v)
-
-        releases = _sort_versions(releases)
-        modded = _sort_versions(modded)
-        snapshots = _sort_versions(snapshots)
-
         choices = []
 
         if recent and recent in installed_names:
@@ -121,17 +105,9 @@ def select_version(mode: str = "download"):
             choices.append(recent)
             choices.append(Separator(" "))
 
-        if releases:
-            choices.append(Separator("---Releases (newest → oldest)---"))
-            choices.extend(releases)
-            choices.append(Separator(" "))
-        if modded:
-            choices.append(Separator("---Modded versions (Forge/Fabric)---"))
-            choices.extend(modded)
-            choices.append(Separator(" "))
-        if snapshots:
-            choices.append(Separator("---Snapshots / RCs---"))
-            choices.extend(snapshots)
+        for title, versions in _group_versions(installed):
+            choices.append(Separator(title))
+            choices.extend(versions)
             choices.append(Separator(" "))
 
         choices.append("Back")
@@ -167,14 +143,14 @@ def select_version(mode: str = "download"):
         if version_type == "Back":
             return "Back"
     
-        all_versions = minecraft_launcher_lib.utils.get_version_list()
-    
         if version_type == "Latest":
-            latest_release = minecraft_launcher_lib.utils.get_latest_version()["release"]
+            latest_release = get_latest_version()["release"]
             print(f"\nLatest release selected: {latest_release}")
             return latest_release
-    
-        elif version_type == "Releases":
+
+        all_versions = get_version_list()
+
+        if version_type == "Releases":
             versions = [v["id"] for v in all_versions if v["type"] == "release"]
         else:
             versions = [v["id"] for v in all_versions if v["type"] != "release"]
@@ -0,0 +1,98 @@
+import os
+import hashlib
+import numpy as np
+from PIL import Image
+from .config_store import CACHE_DIR, load_config, edit_config
+
+SKIN_INDEX_FILE = os.path.join(CACHE_DIR, "skin_index.json")
+HASH_GRID = 16
+NEAR_DUPLICATE_DISTANCE = 12
+
+
+def hash_pixels(pixels: np.ndarray) -> dict:
+    rgba = np.ascontiguousarray(pixels, dtype=np.uint8)
+    alpha = rgba[..., 3].astype(np.float32) / 255
+    gray = (rgba[..., 0] * 0.299 + rgba[..., 1] * 0.587 + rgba[..., 2] * 0.114) * alpha
+
+    height, width = gray.shape
+    cell_y, cell_x = height // HASH_GRID, width // HASH_GRID
+    grid = gray[:cell_y * HASH_GRID, :cell_x * HASH_GRID].reshape(HASH_GRID, cell_y, HASH_GRID, cell_x).mean(axis=(1, 3))
+    bits = (grid[:, 1:] > grid[:, :-1]).flatten()
+
+    return {
+        "sha1": hashlib.sha1(rgba.tobytes() + f"{width}x{height}".encode()).hexdigest(),
+        "dhash": np.packbits(bits).tobytes().hex(),
+    }
+
+
+def hash_skin(path: str) -> dict:
+    with Image.open(path) as img:
+        return hash_pixels(np.asarray(img.convert("RGBA")))
+
+
+def hamming_distance(a: str, b: str) -> int:
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+def _stat_signature(path: str) -> list:
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def update_skin_index(min_skin_dir: str, known: dict = None) -> dict:
+    known = known or {}
+    index = load_config(SKIN_INDEX_FILE)
+    entries = {}
+    changed = False
+
+    names = sorted(n for n in os.listdir(min_skin_dir) if n.lower().endswith(".png")) if os.path.isdir(min_skin_dir) else []
+    for name in names:
+        path = os.path.join(min_skin_dir, name)
+        try:
+            signature = _stat_signature(path)
+        except OSError:
+            continue
+
+        cached = index.get(name)
+        if cached and cached.get("signature") == signature and name not in known:
+            entries[name] = cached
+            continue
+
+        try:
+            hashes = known.get(name) or hash_skin(path)
+        except Exception as e:
+            print(f"Failed to hash skin '{name}': {e}")
+            continue
+        entries[name] = dict(hashes, signature=signature)
+        changed = True
+
+    if changed or set(entries) != set(index):
+        with edit_config(SKIN_INDEX_FILE) as stored:
+            stored.clear()
+            stored.update(entries)
+    return entries
+
+
+def find_matches(hashes: dict, entries: dict, max_distance: int = NEAR_DUPLICATE_DISTANCE, exclude: str = None) -> dict:
+    exact = []
+    near = []
+    for name, entry in entries.items():
+        if name == exclude:
+            continue
+        if entry["sha1"] == hashes["sha1"]:
+            exact.append(name)
+            continue
+        distance = hamming_distance(entry["dhash"], hashes["dhash"])
+        if distance <= max_distance:
+            near.append((name, distance))
+
+    near.sort(key=lambda match: match[1])
+    return {"exact": sorted(exact), "near": near}
+
+
+def search_skins(path: str, min_skin_dir: str, max_distance: int = NEAR_DUPLICATE_DISTANCE) -> dict:
+    from .skin_normalizer import normalize_pixels
+
+    with Image.open(path) as img:
+        _, info = normalize_pixels(np.asarray(img.convert("RGBA")))
+    return find_matches(info["hashes"], update_skin_index(min_skin_dir), max_distance)
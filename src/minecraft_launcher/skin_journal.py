@@ -0,0 +1,114 @@
+import os
+import time
+import uuid
+import shutil
+import threading
+from contextlib import ExitStack
+from .config_store import CACHE_DIR, load_config, edit_config, file_lock
+
+JOURNAL_DIR = os.path.join(CACHE_DIR, "skin_journal")
+STAGING_DIR_NAME = ".skin_staging"
+
+_owned = {}
+_owned_lock = threading.Lock()
+
+
+def staging_path(minecraft_dir: str, name: str) -> str:
+    staging = os.path.join(minecraft_dir, STAGING_DIR_NAME)
+    os.makedirs(staging, exist_ok=True)
+    return os.path.join(staging, f"{uuid.uuid4().hex}-{name}")
+
+
+def discard(path: str):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path, ignore_errors=True)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
+def _owner_lock(path: str) -> str:
+    return f"{path}.owner"
+
+
+def begin_entry(entry: dict) -> str:
+    path = os.path.join(JOURNAL_DIR, f"{uuid.uuid4().hex}.json")
+    owner = ExitStack()
+    owner.enter_context(file_lock(_owner_lock(path)))
+    with _owned_lock:
+        _owned[path] = owner
+
+    with edit_config(path) as data:
+        data.update(entry, created=time.time())
+    return path
+
+
+def update_entry(path: str, **changes):
+    with edit_config(path) as data:
+        data.update(changes)
+
+
+def finish_entry(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+    with _owned_lock:
+        owner = _owned.pop(path, None)
+    if owner:
+        owner.close()
+
+    for leftover in (f"{path}.lock", f"{_owner_lock(path)}.lock"):
+        try:
+            os.remove(leftover)
+        except OSError:
+            pass
+
+
+def pending_entries() -> list:
+    if not os.path.isdir(JOURNAL_DIR):
+        return []
+
+    entries = []
+    for name in os.listdir(JOURNAL_DIR):
+        if not name.endswith(".json"):
+            continue
+        path = os.path.join(JOURNAL_DIR, name)
+        entry = load_config(path)
+        if entry:
+            entries.append((path, entry))
+    entries.sort(key=lambda item: item[1].get("created", 0))
+    return entries
+
+
+def replay_journal() -> int:
+    entries = pending_entries()
+    if not entries:
+        return 0
+
+    from .skin_manager import _commit_journal_entry
+
+    replayed = 0
+    for path, _ in entries:
+        with _owned_lock:
+            if path in _owned:
+                continue
+        try:
+            with file_lock(_owner_lock(path), blocking=False):
+                entry = load_config(path)
+                if not entry:
+                    finish_entry(path)
+                    continue
+                try:
+                    _commit_journal_entry(entry)
+                except Exception as e:
+                    print(f"Failed to recover interrupted skin {entry.get('op')} of '{entry.get('name')}': {e}")
+                    continue
+                finish_entry(path)
+                replayed += 1
+        except BlockingIOError:
+            continue
+
+    if replayed:
+        print(f"Recovered {replayed} interrupted skin operation(s).")
+    return replayed
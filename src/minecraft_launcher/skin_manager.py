@@ -1,12 +1,23 @@
 import os
+import io
+import time
 import shutil
 import json
 import re
+import zipfile
 import questionary
-from tkinter import Tk, filedialog
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
 
 from .path_manager import get_minecraft_dir
+from .config_store import edit_config, get_value
+from .skin_journal import staging_path, discard, begin_entry, update_entry, finish_entry
+
+PLAYER_BRANCHES = ["slim", "wide"]
+PLAYER_VARIANTS = ["alex", "ari", "efe", "kai", "makena", "noor", "steve", "sunny", "zuri"]
+BUILD_WORKERS = 8
+PACK_LAYOUT_FOLDER = "folder"
+PACK_LAYOUT_ZIP = "zip"
+SKIN_EXTENSIONS = (".png", ".jpg", ".jpeg")
 
 
 def _sanitize_name(name: str) -> str:
@@ -18,6 +29,8 @@ def _sanitize_name(name: str) -> str:
 def _confirm_overwrite(path: str, overwrite_all_flag: dict) -> bool:
     if overwrite_all_flag.get("yes_all", False):
         return True
+    if overwrite_all_flag.get("no_prompt", False):
+        return False
 
     print(f"\nResource pack folder '{path}' already exists.")
     confirm = questionary.text(
@@ -30,27 +43,72 @@ def _confirm_overwrite(path: str, overwrite_all_flag: dict) -> bool:
     return confirm == "YES"
 
 
-def _convert_to_png_if_needed(src_path: str, dest_dir: str) -> str:
-    ext = os.path.splitext(src_path)[1].lower()
-    if ext in (".png",):
-        return src_path
+def _normalize_into_library(jobs: list, min_skin_dir: str, interactive: bool = False) -> tuple:
+    from .skin_normalizer import normalize_skins
+    from .skin_index import update_skin_index, find_matches
 
-    if ext not in (".jpg", ".jpeg"):
-        return None
+    existed = {dest_path for _, dest_path in jobs if os.path.exists(dest_path)}
+    entries = update_skin_index(min_skin_dir)
+    known = {}
+    normalized = []
+    invalid = []
+    duplicates = []
 
-    try:
-        img = Image.open(src_path).convert("RGBA")
-        new_name = _sanitize_name(os.path.basename(src_path)) + ".png"
-        new_path = os.path.join(dest_dir, new_name)
-        img.save(new_path, "PNG")
-        print(f"Converted {src_path} -> {new_path}")
-        return new_path
-    except Exception as e:
-        print(f"Failed to convert {src_path}: {e}")
-        return None
+    for src_path, dest_path, info, error in normalize_skins(jobs):
+        if error:
+            print(f"Invalid skin {src_path}: {error}")
+            invalid.append({"path": src_path, "error": error})
+            continue
+        if info["legacy"] or info["scaled"]:
+            width, height = info["source_size"]
+            print(f"Normalized {os.path.basename(src_path)} from {width}x{height} to 64x64.")
+
+        name = os.path.basename(dest_path)
+        matches = find_matches(info["hashes"], entries, exclude=name)
+        if matches["exact"] and dest_path not in existed:
+            print(f"Skipping {src_path}: identical to existing skin '{matches['exact'][0]}'.")
+            duplicates.append({"path": src_path, "existing": matches["exact"][0]})
+            os.remove(dest_path)
+            continue
 
+        if matches["near"]:
+            similar = ", ".join(f"{match} (distance {distance})" for match, distance in matches["near"][:3])
+            print(f"{os.path.basename(src_path)} looks similar to: {similar}")
+            if interactive and dest_path not in existed and not questionary.confirm(
+                "Import it anyway?", default=True
+            ).ask():
+                os.remove(dest_path)
+                continue
 
-def _copy_skin_pack(skin_image_path: str, minecraft_dir: str, overwrite_all_flag: dict, skin_name: str = None):
+        entries[name] = info["hashes"]
+        known[name] = info["hashes"]
+        normalized.append(dest_path)
+
+    update_skin_index(min_skin_dir, known)
+    return normalized, invalid, duplicates
+
+
+def _reuse_duplicates(duplicates: list, normalized: list, minecraft_dir: str, min_skin_dir: str):
+    for duplicate in duplicates:
+        existing_path = os.path.join(min_skin_dir, duplicate["existing"])
+        existing_name = os.path.splitext(duplicate["existing"])[0]
+        if not _pack_exists(minecraft_dir, existing_name) and existing_path not in normalized:
+            normalized.append(existing_path)
+
+
+def _existing_pack(minecraft_dir: str, skin_name: str):
+    folder_path = os.path.join(minecraft_dir, "resourcepacks", skin_name)
+    for path in (folder_path, f"{folder_path}.zip"):
+        if os.path.exists(path):
+            return os.path.basename(path)
+    return None
+
+
+def _pack_exists(minecraft_dir: str, skin_name: str) -> bool:
+    return _existing_pack(minecraft_dir, skin_name) is not None
+
+
+def _resolve_skin_pack(skin_image_path: str, minecraft_dir: str, overwrite_all_flag: dict, skin_name: str = None):
     resourcepacks_dir = os.path.join(minecraft_dir, "resourcepacks")
 
     original_filename = os.path.basename(skin_image_path)
@@ -63,62 +121,225 @@ def _copy_skin_pack(skin_image_path: str, minecraft_dir: str, overwrite_all_flag
         ).ask()
         if not new_name:
             print("No name entered, skipping this skin pack.")
-            return False
+            return None
         skin_name = _sanitize_name(new_name)
     else:
         skin_name = _sanitize_name(skin_name)
 
-    resourcepack_dir = os.path.join(resourcepacks_dir, skin_name)
+    folder_path = os.path.join(resourcepacks_dir, skin_name)
+    zip_path = f"{folder_path}.zip"
+    existing = [p for p in (folder_path, zip_path) if os.path.exists(p)]
 
-    if os.path.exists(resourcepack_dir):
-        if not _confirm_overwrite(resourcepack_dir, overwrite_all_flag):
+    if existing:
+        if not _confirm_overwrite(existing[0], overwrite_all_flag):
             print(f"Skipping skin '{skin_name}'.")
-            return False
-        shutil.rmtree(resourcepack_dir)
+            return None
+
+    if _pack_layout() == PACK_LAYOUT_ZIP:
+        return zip_path
+    return folder_path
+
+
+def _pack_layout() -> str:
+    return get_value("skin_pack_format", PACK_LAYOUT_FOLDER)
+
+
+def _list_skin_packs(resourcepacks_dir: str) -> list:
+    return sorted(
+        name for name in os.listdir(resourcepacks_dir)
+        if os.path.isdir(os.path.join(resourcepacks_dir, name)) or name.endswith(".zip")
+    )
+
+
+def _skin_stem(pack_name: str) -> str:
+    return pack_name[:-4] if pack_name.endswith(".zip") else pack_name
+
+
+def _skin_choices(skin_packs: list, min_skin_dir: str) -> tuple:
+    try:
+        from .skin_preview import previews_enabled, get_thumbnails, face_title
+        if not previews_enabled():
+            return skin_packs, {}
+        thumbnails = get_thumbnails(min_skin_dir)
+    except Exception as e:
+        print(f"Failed to load skin previews: {e}")
+        return skin_packs, {}
+
+    choices = []
+    for pack in skin_packs:
+        tile = thumbnails.get(f"{_skin_stem(pack)}.png")
+        title = face_title(tile, pack) if tile is not None else [("", f"         {pack}")]
+        choices.append(questionary.Choice(title=title, value=pack))
+    return choices, thumbnails
+
+
+def _show_preview(pack_name: str, thumbnails: dict):
+    tile = thumbnails.get(f"{_skin_stem(pack_name)}.png")
+    if tile is None:
+        return
+    from .skin_preview import body_ansi
+    print(f"\n{body_ansi(tile)}\n")
+
+
+def _pack_entries(icon_ext: str) -> list:
+    entity_dir = "assets/minecraft/textures/entity"
+    entries = [
+        f"{entity_dir}/player/{branch}/{variant}.png"
+        for branch in PLAYER_BRANCHES
+        for variant in PLAYER_VARIANTS
+    ]
+    entries.extend(f"{entity_dir}/{name}.png" for name in ["alex", "steve"])
+    entries.append(f"pack{icon_ext}")
+    return entries
+
+
+def _default_mcmeta() -> dict:
+    return {
+        "pack": {
+            "pack_format": 0,
+            "min_format": [0, 0],
+            "max_format": [0, 0],
+            "supported_formats": [0, 0],
+            "description": "Custom Player Skin"
+        }
+    }
 
-    textures_dir = os.path.join(resourcepack_dir, "assets", "minecraft", "textures", "entity", "player")
-    branches = ["slim", "wide"]
-    player_variants = ["alex", "ari", "efe", "kai", "makena", "noor", "steve", "sunny", "zuri"]
 
-    for branch in branches:
-        branch_dir = os.path.join(textures_dir, branch)
-        os.makedirs(branch_dir, exist_ok=True)
+def _link_or_copy(src: str, dst: str):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _build_skin_pack_zip(skin_image_path: str, zip_path: str):
+    with open(skin_image_path, "rb") as f:
+        texture = f.read()
+
+    date_time = time.localtime()[:6]
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for entry in _pack_entries(os.path.splitext(skin_image_path)[1]):
+            info = zipfile.ZipInfo(entry, date_time=date_time)
+            info.compress_type = zipfile.ZIP_STORED
+            archive.writestr(info, texture)
+        archive.writestr("pack.mcmeta", json.dumps(_default_mcmeta(), indent=2), zipfile.ZIP_DEFLATED)
+
+    tmp_path = f"{zip_path}.{os.getpid()}.tmp"
+    os.makedirs(os.path.dirname(zip_path), exist_ok=True)
+    with open(tmp_path, "wb") as f:
+        f.write(buffer.getvalue())
+    os.replace(tmp_path, zip_path)
+
+
+def _build_skin_pack(skin_image_path: str, resourcepack_dir: str):
+    if resourcepack_dir.endswith(".zip"):
+        _build_skin_pack_zip(skin_image_path, resourcepack_dir)
+        return
 
-    for branch in branches:
-        for variant in player_variants:
-            shutil.copy2(skin_image_path, os.path.join(textures_dir, branch, f"{variant}.png"))
+    icon_ext = os.path.splitext(skin_image_path)[1]
+    paths = [os.path.join(resourcepack_dir, *entry.split("/")) for entry in _pack_entries(icon_ext)]
 
-    entity_dir = os.path.join(resourcepack_dir, "assets", "minecraft", "textures", "entity")
-    for name in ["alex", "steve"]:
-        shutil.copy2(skin_image_path, os.path.join(entity_dir, f"{name}.png"))
+    for directory in {os.path.dirname(p) for p in paths}:
+        os.makedirs(directory, exist_ok=True)
 
-    pack_icon_ext = os.path.splitext(original_filename)[1]
-    pack_icon_path = os.path.join(resourcepack_dir, f"pack{pack_icon_ext}")
-    shutil.copy2(skin_image_path, pack_icon_path)
+    shutil.copy2(skin_image_path, paths[0])
+    for path in paths[1:]:
+        _link_or_copy(paths[0], path)
 
     mcmeta_path = os.path.join(resourcepack_dir, "pack.mcmeta")
     if not os.path.exists(mcmeta_path):
-        mcmeta_content = {
-            "pack": {
-                "pack_format": 0,
-                "min_format": [0, 0],
-                "max_format": [0, 0],
-                "supported_formats": [0, 0],
-                "description": "Custom Player Skin"
-            }
-        }
         try:
             with open(mcmeta_path, "w", encoding="utf-8") as f:
-                json.dump(mcmeta_content, f, indent=2)
+                json.dump(_default_mcmeta(), f, indent=2)
         except Exception as e:
             print(f"Failed to create pack.mcmeta: {e}")
 
+
+def _swap_staged_pack(entry: dict) -> bool:
+    if entry["phase"] != "commit":
+        discard(entry["staged"])
+        return False
+
+    if os.path.lexists(entry["staged"]):
+        os.makedirs(os.path.dirname(entry["target"]), exist_ok=True)
+        for existing, backup in entry["backups"]:
+            if os.path.lexists(existing):
+                os.replace(existing, backup)
+        os.replace(entry["staged"], entry["target"])
+    for _, backup in entry["backups"]:
+        discard(backup)
+    return True
+
+
+def _stage_skin_pack(skin_image_path: str, resourcepack_dir: str) -> tuple:
+    resourcepacks_dir, name = os.path.split(resourcepack_dir)
+    minecraft_dir = os.path.dirname(resourcepacks_dir)
+    folder_path = os.path.join(resourcepacks_dir, _skin_stem(name))
+    entry = {
+        "op": "build",
+        "phase": "staging",
+        "name": name,
+        "target": resourcepack_dir,
+        "staged": staging_path(minecraft_dir, name),
+        "backups": [
+            [path, staging_path(minecraft_dir, os.path.basename(path))]
+            for path in (folder_path, f"{folder_path}.zip")
+        ],
+    }
+    journal = begin_entry(entry)
+
+    try:
+        _build_skin_pack(skin_image_path, entry["staged"])
+    except Exception:
+        discard(entry["staged"])
+        finish_entry(journal)
+        raise
+
+    update_entry(journal, phase="commit")
+    entry["phase"] = "commit"
+    _swap_staged_pack(entry)
+    return journal, entry
+
+
+def _build_skin_packs(jobs: list, max_workers: int = BUILD_WORKERS, failed: list = None) -> list:
+    def _run(job):
+        skin_image_path, resourcepack_dir = job
+        try:
+            return _stage_skin_pack(skin_image_path, resourcepack_dir)
+        except Exception as e:
+            print(f"Failed to build skin pack '{os.path.basename(resourcepack_dir)}': {e}")
+            if failed is not None:
+                failed.append({"pack": os.path.basename(resourcepack_dir), "error": str(e)})
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        built = [result for result in pool.map(_run, jobs) if result]
+
+    try:
+        with edit_config():
+            for _, entry in built:
+                _register_custom_skin_pack(entry["name"])
+    except Exception as e:
+        print(f"Failed to update launcher_config.json: {e}")
+        return [entry["target"] for _, entry in built]
+
+    for journal, _ in built:
+        finish_entry(journal)
+    return [entry["target"] for _, entry in built]
+
+
+def _copy_skin_pack(skin_image_path: str, minecraft_dir: str, overwrite_all_flag: dict, skin_name: str = None):
+    resourcepack_dir = _resolve_skin_pack(skin_image_path, minecraft_dir, overwrite_all_flag, skin_name)
+    if not resourcepack_dir or not _build_skin_packs([(skin_image_path, resourcepack_dir)]):
+        return False
+
     print(f"Skin pack created successfully at:\n{resourcepack_dir}")
-    _register_custom_skin_pack(os.path.basename(resourcepack_dir))
     return True
 
 
 def _open_file_manager(select_type: str):
+    from tkinter import Tk, filedialog
     root = Tk()
     root.withdraw()
     root.update()
@@ -135,58 +356,85 @@ def _open_file_manager(select_type: str):
 
 
 def _register_custom_skin_pack(pack_name: str):
-    launcher_config_path = os.path.abspath("launcher_config.json")
-    data = {}
-
-    if os.path.exists(launcher_config_path):
-        try:
-            with open(launcher_config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception:
-            data = {}
-
-    if "custom_skins" not in data or not isinstance(data["custom_skins"], list):
-        data["custom_skins"] = []
-
-    if pack_name not in data["custom_skins"]:
+    with edit_config() as data:
+        if not isinstance(data.get("custom_skins"), list):
+            data["custom_skins"] = []
+        if pack_name in data["custom_skins"]:
+            return
         data["custom_skins"].append(pack_name)
-        try:
-            with open(launcher_config_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-            print(f"Registered custom skin pack: {pack_name}")
-        except Exception as e:
-            print(f"Failed to update launcher_config.json: {e}")
+    print(f"Registered custom skin pack: {pack_name}")
 
 
 def _update_launcher_config_rename(old_name: str, new_name: str):
-    launcher_config_path = os.path.abspath("launcher_config.json")
-    if not os.path.exists(launcher_config_path):
-        return
-    try:
-        with open(launcher_config_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    with edit_config() as data:
         if "custom_skins" in data and old_name in data["custom_skins"]:
             data["custom_skins"].remove(old_name)
             data["custom_skins"].append(new_name)
-        with open(launcher_config_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-    except Exception:
-        pass
 
 
 def _update_launcher_config_delete(name: str):
-    launcher_config_path = os.path.abspath("launcher_config.json")
-    if not os.path.exists(launcher_config_path):
-        return
-    try:
-        with open(launcher_config_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    with edit_config() as data:
         if "custom_skins" in data and name in data["custom_skins"]:
             data["custom_skins"].remove(name)
-        with open(launcher_config_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-    except Exception:
-        pass
+
+
+def _commit_rename(entry: dict):
+    for src, dst in entry["moves"]:
+        if os.path.lexists(src) and not os.path.lexists(dst):
+            os.replace(src, dst)
+    _update_launcher_config_rename(entry["name"], entry["new_name"])
+
+
+def _commit_delete(entry: dict):
+    if os.path.lexists(entry["pack"]):
+        os.replace(entry["pack"], entry["trash"])
+    if os.path.exists(entry["skin"]):
+        os.remove(entry["skin"])
+    _update_launcher_config_delete(entry["name"])
+    discard(entry["trash"])
+
+
+def _rename_skin_pack(minecraft_dir: str, min_skin_dir: str, pack_name: str, new_skin_name: str) -> str:
+    resourcepacks_dir = os.path.join(minecraft_dir, "resourcepacks")
+    new_pack_name = new_skin_name + (".zip" if pack_name.endswith(".zip") else "")
+    entry = {
+        "op": "rename",
+        "name": pack_name,
+        "new_name": new_pack_name,
+        "moves": [
+            [os.path.join(resourcepacks_dir, pack_name), os.path.join(resourcepacks_dir, new_pack_name)],
+            [os.path.join(min_skin_dir, f"{_skin_stem(pack_name)}.png"), os.path.join(min_skin_dir, f"{new_skin_name}.png")],
+        ],
+    }
+
+    journal = begin_entry(entry)
+    _commit_rename(entry)
+    finish_entry(journal)
+    return new_pack_name
+
+
+def _delete_skin_pack(minecraft_dir: str, min_skin_dir: str, pack_name: str):
+    entry = {
+        "op": "delete",
+        "name": pack_name,
+        "pack": os.path.join(minecraft_dir, "resourcepacks", pack_name),
+        "trash": staging_path(minecraft_dir, pack_name),
+        "skin": os.path.join(min_skin_dir, f"{_skin_stem(pack_name)}.png"),
+    }
+
+    journal = begin_entry(entry)
+    _commit_delete(entry)
+    finish_entry(journal)
+
+
+def _commit_journal_entry(entry: dict):
+    if entry["op"] == "build":
+        if _swap_staged_pack(entry):
+            _register_custom_skin_pack(entry["name"])
+    elif entry["op"] == "rename":
+        _commit_rename(entry)
+    elif entry["op"] == "delete":
+        _commit_delete(entry)
 
 
 def apply_skin():
@@ -199,7 +447,7 @@ def apply_skin():
         print("No images selected.")
         return
 
-    processed_files = []
+    normalize_jobs = []
     overwrite_all_flag = {"yes_all": False}
 
     for src_path in skin_files:
@@ -217,37 +465,93 @@ def apply_skin():
 
         dest_path = os.path.join(min_skin_dir, f"{skin_name}.png")
 
-        if ext in (".jpg", ".jpeg"):
-            converted_path = _convert_to_png_if_needed(src_path, min_skin_dir)
-            if converted_path:
-                final_path = os.path.join(min_skin_dir, f"{skin_name}.png")
-                os.rename(converted_path, final_path)
-                processed_files.append(final_path)
-            continue
-        else:
-            if os.path.exists(dest_path) and not overwrite_all_flag["yes_all"]:
-                confirm = questionary.text(
-                    f"File '{skin_name}.png' exists in min_skin. Type YES to overwrite, YES-ALL to overwrite all remaining, anything else to skip:"
-                ).ask()
-                if confirm == "YES-ALL":
-                    overwrite_all_flag["yes_all"] = True
-                elif confirm != "YES":
-                    print(f"Skipping {skin_name}")
-                    continue
-            shutil.copy2(src_path, dest_path)
-            processed_files.append(dest_path)
-
-    created_count = 0
+        if os.path.exists(dest_path) and not overwrite_all_flag["yes_all"]:
+            confirm = questionary.text(
+                f"File '{skin_name}.png' exists in min_skin. Type YES to overwrite, YES-ALL to overwrite all remaining, anything else to skip:"
+            ).ask()
+            if confirm == "YES-ALL":
+                overwrite_all_flag["yes_all"] = True
+            elif confirm != "YES":
+                print(f"Skipping {skin_name}")
+                continue
+        normalize_jobs.append((src_path, dest_path))
+
+    processed_files, _, duplicates = _normalize_into_library(normalize_jobs, min_skin_dir, interactive=True)
+    _reuse_duplicates(duplicates, processed_files, minecraft_dir, min_skin_dir)
+
+    jobs = []
     overwrite_all_flag = {"yes_all": False}
     for skin_path in processed_files:
         skin_base_name = os.path.splitext(os.path.basename(skin_path))[0]
-        if _copy_skin_pack(skin_path, minecraft_dir, overwrite_all_flag, skin_name=skin_base_name):
-            created_count += 1
+        resourcepack_dir = _resolve_skin_pack(skin_path, minecraft_dir, overwrite_all_flag, skin_name=skin_base_name)
+        if resourcepack_dir:
+            jobs.append((skin_path, resourcepack_dir))
+
+    failed = []
+    created_count = len(_build_skin_packs(jobs, failed=failed))
 
     if created_count == 0:
         print("No skin packs were created.")
     else:
         print(f"\n{created_count} skin pack(s) created successfully.")
+    if failed:
+        print(f"{len(failed)} skin pack(s) failed to build.")
+
+
+def _collect_skin_files(paths: list) -> list:
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.lower().endswith(SKIN_EXTENSIONS)
+            )
+        elif path.lower().endswith(SKIN_EXTENSIONS):
+            files.append(path)
+    return files
+
+
+def import_skins(paths: list, overwrite: bool = False) -> dict:
+    minecraft_dir = get_minecraft_dir()
+    min_skin_dir = os.path.abspath("min_skin")
+    os.makedirs(min_skin_dir, exist_ok=True)
+
+    result = {"created": [], "skipped": [], "invalid": [], "duplicates": [], "failed": []}
+    overwrite_flag = {"yes_all": overwrite, "no_prompt": True}
+    normalize_jobs = {}
+    jobs = []
+
+    for src_path in _collect_skin_files(paths):
+        skin_name = _sanitize_name(os.path.basename(src_path))
+        dest_path = os.path.join(min_skin_dir, f"{skin_name}.png")
+
+        if dest_path in normalize_jobs or (not overwrite and (
+            _pack_exists(minecraft_dir, skin_name)
+            or (os.path.exists(dest_path) and not os.path.samefile(src_path, dest_path))
+        )):
+            result["skipped"].append(src_path)
+            continue
+        normalize_jobs[dest_path] = src_path
+
+    new_files = {dest_path for dest_path in normalize_jobs if not os.path.exists(dest_path)}
+    normalized, result["invalid"], result["duplicates"] = _normalize_into_library(
+        [(src, dest) for dest, src in normalize_jobs.items()], min_skin_dir
+    )
+
+    _reuse_duplicates(result["duplicates"], normalized, minecraft_dir, min_skin_dir)
+
+    for dest_path in normalized:
+        skin_name = os.path.splitext(os.path.basename(dest_path))[0]
+        resourcepack_dir = _resolve_skin_pack(dest_path, minecraft_dir, overwrite_flag, skin_name=skin_name)
+        if not resourcepack_dir:
+            result["skipped"].append(normalize_jobs.get(dest_path, dest_path))
+            if dest_path in new_files:
+                os.remove(dest_path)
+            continue
+        jobs.append((dest_path, resourcepack_dir))
+
+    result["created"] = [os.path.basename(d) for d in _build_skin_packs(jobs, failed=result["failed"])]
+    return result
 
 
 def rename_skin():
@@ -259,20 +563,22 @@ def rename_skin():
         print("\nNo resourcepacks directory found.\n")
         return
 
-    skin_packs = [d for d in os.listdir(resourcepacks_dir) if os.path.isdir(os.path.join(resourcepacks_dir, d))]
+    skin_packs = _list_skin_packs(resourcepacks_dir)
     if not skin_packs:
         print("\nNo skins found to rename.\n")
         return
 
+    choices, thumbnails = _skin_choices(skin_packs, min_skin_dir)
     selected = questionary.select(
         "Select a skin to rename:",
-        choices=skin_packs + ["Cancel"]
+        choices=choices + ["Cancel"]
     ).ask()
 
     if selected == "Cancel" or not selected:
         print("\nRename canceled.\n")
         return
 
+    _show_preview(selected, thumbnails)
     new_name = questionary.text(
         "Enter new skin name:",
         default=selected
@@ -283,22 +589,12 @@ def rename_skin():
         return
 
     new_name_sanitized = _sanitize_name(new_name)
-    old_pack_path = os.path.join(resourcepacks_dir, selected)
-    new_pack_path = os.path.join(resourcepacks_dir, new_name_sanitized)
-
-    if os.path.exists(new_pack_path):
+    if _pack_exists(minecraft_dir, new_name_sanitized):
         print("\nA skin with that name already exists.\n")
         return
 
     try:
-        os.rename(old_pack_path, new_pack_path)
-
-        old_skin_path = os.path.join(min_skin_dir, f"{selected}.png")
-        new_skin_path = os.path.join(min_skin_dir, f"{new_name_sanitized}.png")
-        if os.path.exists(old_skin_path):
-            os.rename(old_skin_path, new_skin_path)
-
-        _update_launcher_config_rename(selected, new_name_sanitized)
+        _rename_skin_pack(minecraft_dir, min_skin_dir, selected, new_name_sanitized)
         print(f"\nSkin renamed to '{new_name_sanitized}'.\n")
     except Exception as e:
         print(f"\nFailed to rename skin: {e}\n")
@@ -314,20 +610,22 @@ def delete_skin():
         print("\nNo resourcepacks directory found.\n")
         return
 
-    skin_packs = [d for d in os.listdir(resourcepacks_dir) if os.path.isdir(os.path.join(resourcepacks_dir, d))]
+    skin_packs = _list_skin_packs(resourcepacks_dir)
     if not skin_packs:
         print("\nNo skins found to delete.\n")
         return
 
+    choices, thumbnails = _skin_choices(skin_packs, min_skin_dir)
     selected = questionary.select(
         "Select a skin to delete:",
-        choices=skin_packs + ["Cancel"]
+        choices=choices + ["Cancel"]
     ).ask()
 
     if selected == "Cancel" or not selected:
         print("\nDeletion canceled.\n")
         return
 
+    _show_preview(selected, thumbnails)
     confirm = questionary.text(
         f"Type YES to confirm deletion of '{selected}':"
     ).ask()
@@ -337,13 +635,7 @@ def delete_skin():
         return
 
     try:
-        shutil.rmtree(os.path.join(resourcepacks_dir, selected))
-
-        skin_file_path = os.path.join(min_skin_dir, f"{selected}.png")
-        if os.path.exists(skin_file_path):
-            os.remove(skin_file_path)
-
-        _update_launcher_config_delete(selected)
+        _delete_skin_pack(minecraft_dir, min_skin_dir, selected)
         print(f"\nSkin '{selected}' deleted successfully.\n")
     except Exception as e:
         print(f"\nFailed to delete skin: {e}\n")
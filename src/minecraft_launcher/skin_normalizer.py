@@ -0,0 +1,110 @@
+import os
+import numpy as np
+from PIL import Image
+from concurrent.futures import ProcessPoolExecutor
+from .skin_index import hash_pixels
+
+SKIN_WIDTH = 64
+NORMALIZE_WORKERS = os.cpu_count() or 1
+
+# Vanilla's legacy skin upgrade: (x, y, dx, dy, width, height), each copied mirrored on X.
+_LEGACY_COPY_RECTS = [
+    (4, 16, 16, 32, 4, 4),
+    (8, 16, 16, 32, 4, 4),
+    (0, 20, 24, 32, 4, 12),
+    (4, 20, 16, 32, 4, 12),
+    (8, 20, 8, 32, 4, 12),
+    (12, 20, 16, 32, 4, 12),
+    (44, 16, -8, 32, 4, 4),
+    (48, 16, -8, 32, 4, 4),
+    (40, 20, 0, 32, 4, 12),
+    (44, 20, -8, 32, 4, 12),
+    (48, 20, -16, 32, 4, 12),
+    (52, 20, -8, 32, 4, 12),
+]
+# Base layer regions the game renders opaque: (x0, y0, x1, y1).
+_OPAQUE_REGIONS = [(0, 0, 32, 16), (0, 16, 64, 32), (16, 48, 48, 64)]
+_LEGACY_HAT_REGION = (32, 0, 64, 32)
+
+
+def validate_skin(pixels: np.ndarray):
+    height, width = pixels.shape[:2]
+    if width < SKIN_WIDTH or width % SKIN_WIDTH:
+        raise ValueError(f"Unsupported skin size {width}x{height}: width must be a multiple of 64.")
+    if height not in (width, width // 2):
+        raise ValueError(f"Unsupported skin size {width}x{height}: expected a 64x64 or 64x32 layout.")
+    if not pixels[..., 3].any():
+        raise ValueError("Skin is fully transparent.")
+
+
+def _downscale(pixels: np.ndarray) -> np.ndarray:
+    factor = pixels.shape[1] // SKIN_WIDTH
+    if factor == 1:
+        return pixels
+    offset = factor // 2
+    return pixels[offset::factor, offset::factor]
+
+
+def _upgrade_legacy(pixels: np.ndarray) -> np.ndarray:
+    upgraded = np.zeros((SKIN_WIDTH, SKIN_WIDTH, 4), dtype=np.uint8)
+    upgraded[:32] = pixels
+    for x, y, dx, dy, width, height in _LEGACY_COPY_RECTS:
+        upgraded[y + dy:y + dy + height, x + dx:x + dx + width] = pixels[y:y + height, x:x + width][:, ::-1]
+    return upgraded
+
+
+def _notch_transparency_hack(pixels: np.ndarray, region: tuple):
+    x0, y0, x1, y1 = region
+    alpha = pixels[y0:y1, x0:x1, 3]
+    if (alpha < 128).any():
+        return
+    alpha[:] = 0
+
+
+def normalize_pixels(pixels: np.ndarray) -> tuple:
+    validate_skin(pixels)
+    info = {"source_size": [int(pixels.shape[1]), int(pixels.shape[0])], "legacy": False, "scaled": False}
+
+    pixels = _downscale(pixels)
+    info["scaled"] = pixels.shape[1] != info["source_size"][0]
+
+    if pixels.shape[0] == SKIN_WIDTH // 2:
+        pixels = _upgrade_legacy(pixels)
+        _notch_transparency_hack(pixels, _LEGACY_HAT_REGION)
+        info["legacy"] = True
+    else:
+        pixels = pixels.copy()
+
+    for x0, y0, x1, y1 in _OPAQUE_REGIONS:
+        pixels[y0:y1, x0:x1, 3] = 255
+    info["hashes"] = hash_pixels(pixels)
+    return pixels, info
+
+
+def normalize_skin(src_path: str, dest_path: str) -> dict:
+    with Image.open(src_path) as img:
+        pixels = np.asarray(img.convert("RGBA"))
+
+    normalized, info = normalize_pixels(pixels)
+
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    tmp_path = f"{dest_path}.{os.getpid()}.tmp"
+    Image.fromarray(normalized, "RGBA").save(tmp_path, "PNG")
+    os.replace(tmp_path, dest_path)
+    return info
+
+
+def _normalize_job(job: tuple):
+    src_path, dest_path = job
+    try:
+        return src_path, dest_path, normalize_skin(src_path, dest_path), None
+    except Exception as e:
+        return src_path, dest_path, None, str(e)
+
+
+def normalize_skins(jobs: list, max_workers: int = NORMALIZE_WORKERS) -> list:
+    if len(jobs) <= 1 or max_workers <= 1:
+        return [_normalize_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+        return list(pool.map(_normalize_job, jobs, chunksize=max(1, len(jobs) // (max_workers * 4))))
@@ -0,0 +1,134 @@
+import os
+import sys
+import json
+import struct
+import numpy as np
+from PIL import Image
+from .config_store import CACHE_DIR, get_value
+from .skin_index import update_skin_index
+
+ATLAS_FILE = os.path.join(CACHE_DIR, "skin_thumbnails.atlas")
+ATLAS_MAGIC = b"MLSA"
+ATLAS_VERSION = 1
+TILE_WIDTH = 16
+TILE_HEIGHT = 32
+
+# Front faces of the 64x64 layout: (u, v, width, height) of base and overlay, and where they go in the tile.
+_BODY_PARTS = [
+    ((8, 8, 8, 8), (40, 8), (4, 0)),
+    ((20, 20, 8, 12), (20, 36), (4, 8)),
+    ((44, 20, 4, 12), (44, 36), (0, 8)),
+    ((36, 52, 4, 12), (52, 52), (12, 8)),
+    ((4, 20, 4, 12), (4, 36), (4, 20)),
+    ((20, 52, 4, 12), (4, 52), (8, 20)),
+]
+
+
+def _blend(base: np.ndarray, overlay: np.ndarray) -> np.ndarray:
+    alpha = overlay[..., 3:4].astype(np.float32) / 255
+    blended = base.astype(np.float32)
+    blended[..., :3] = overlay[..., :3] * alpha + blended[..., :3] * (1 - alpha)
+    blended[..., 3] = np.maximum(base[..., 3], overlay[..., 3])
+    return blended.astype(np.uint8)
+
+
+def render_body(pixels: np.ndarray) -> np.ndarray:
+    tile = np.zeros((TILE_HEIGHT, TILE_WIDTH, 4), dtype=np.uint8)
+    for (u, v, width, height), (ou, ov), (x, y) in _BODY_PARTS:
+        base = pixels[v:v + height, u:u + width]
+        overlay = pixels[ov:ov + height, ou:ou + width]
+        tile[y:y + height, x:x + width] = _blend(base, overlay)
+    return tile
+
+
+def _load_atlas() -> tuple:
+    try:
+        with open(ATLAS_FILE, "rb") as f:
+            magic, version, header_size = struct.unpack("<4sII", f.read(12))
+            if magic != ATLAS_MAGIC or version != ATLAS_VERSION:
+                return {}, None
+            slots = json.loads(f.read(header_size))
+            count = len(slots) * TILE_HEIGHT * TILE_WIDTH * 4
+            tiles = np.fromfile(f, dtype=np.uint8, count=count).reshape(len(slots), TILE_HEIGHT, TILE_WIDTH, 4)
+        return slots, tiles
+    except (OSError, ValueError, struct.error):
+        return {}, None
+
+
+def _write_atlas(tiles_by_hash: dict):
+    header = json.dumps({sha1: i for i, sha1 in enumerate(tiles_by_hash)}).encode("utf-8")
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f"{ATLAS_FILE}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(struct.pack("<4sII", ATLAS_MAGIC, ATLAS_VERSION, len(header)))
+        f.write(header)
+        for tile in tiles_by_hash.values():
+            f.write(np.ascontiguousarray(tile).tobytes())
+    os.replace(tmp_path, ATLAS_FILE)
+
+
+def get_thumbnails(min_skin_dir: str) -> dict:
+    entries = update_skin_index(min_skin_dir)
+    slots, tiles = _load_atlas()
+
+    thumbnails = {}
+    missing = {}
+    for name, entry in entries.items():
+        slot = slots.get(entry["sha1"])
+        if slot is not None and tiles is not None:
+            thumbnails[name] = tiles[slot]
+        else:
+            missing[name] = entry["sha1"]
+
+    if not missing:
+        return thumbnails
+
+    for name in missing:
+        try:
+            with Image.open(os.path.join(min_skin_dir, name)) as img:
+                pixels = np.asarray(img.convert("RGBA"))
+            thumbnails[name] = render_body(pixels) if pixels.shape[:2] == (64, 64) else None
+        except Exception as e:
+            print(f"Failed to render preview for '{name}': {e}")
+            thumbnails[name] = None
+
+    live = {entry["sha1"]: thumbnails[name] for name, entry in entries.items() if thumbnails.get(name) is not None}
+    try:
+        _write_atlas(live)
+    except OSError as e:
+        print(f"Failed to write skin thumbnail cache: {e}")
+    return {name: tile for name, tile in thumbnails.items() if tile is not None}
+
+
+def previews_enabled() -> bool:
+    return bool(get_value("skin_previews", True)) and sys.stdout.isatty()
+
+
+def _hex(pixel) -> str:
+    return f"#{int(pixel[0]):02x}{int(pixel[1]):02x}{int(pixel[2]):02x}"
+
+
+def face_title(tile: np.ndarray, label: str) -> list:
+    face = tile[0:8, 4:12].astype(np.float32)
+    top = face[0:4].mean(axis=0)
+    bottom = face[4:8].mean(axis=0)
+    fragments = [(f"fg:{_hex(t)} bg:{_hex(b)}", "▀") for t, b in zip(top, bottom)]
+    fragments.append(("", f" {label}"))
+    return fragments
+
+
+def body_ansi(tile: np.ndarray) -> str:
+    lines = []
+    for y in range(0, TILE_HEIGHT, 2):
+        cells = []
+        for top, bottom in zip(tile[y], tile[y + 1]):
+            if top[3] < 128 and bottom[3] < 128:
+                cells.append("\x1b[0m ")
+            elif top[3] < 128:
+                cells.append(f"\x1b[0;38;2;{bottom[0]};{bottom[1]};{bottom[2]}m▄")
+            elif bottom[3] < 128:
+                cells.append(f"\x1b[0;38;2;{top[0]};{top[1]};{top[2]}m▀")
+            else:
+                cells.append(f"\x1b[38;2;{top[0]};{top[1]};{top[2]};48;2;{bottom[0]};{bottom[1]};{bottom[2]}m▀")
+        lines.append("".join(cells) + "\x1b[0m")
+    return "\n".join(lines)
@@ -0,0 +1,231 @@
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+
+from .path_manager import get_minecraft_dir
+from .skin_manager import (
+    _sanitize_name, _existing_pack, _resolve_skin_pack, _build_skin_packs,
+    _rename_skin_pack, _delete_skin_pack, _normalize_into_library,
+)
+
+DEBOUNCE_SECONDS = 1.0
+MAX_BATCH_DELAY = 10.0
+POLL_INTERVAL = 1.0
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _is_skin(name: str) -> bool:
+    return name.lower().endswith(".png")
+
+
+def _stat_signature(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def _snapshot(min_skin_dir: str) -> dict:
+    snapshot = {}
+    for name in os.listdir(min_skin_dir):
+        if _is_skin(name):
+            signature = _stat_signature(os.path.join(min_skin_dir, name))
+            if signature:
+                snapshot[name] = signature
+    return snapshot
+
+
+def _diff(current: dict, previous: dict) -> set:
+    return {name for name in set(current) | set(previous) if current.get(name) != previous.get(name)}
+
+
+def _inotify_open(path: str):
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(path), WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+
+def _read_events(fd: int, timeout) -> tuple:
+    ready, _, _ = select.select([fd], [], [], timeout)
+    if not ready:
+        return set(), False, False
+    try:
+        data = os.read(fd, 64 * 1024)
+    except OSError as e:
+        if e.errno == errno.EAGAIN:
+            return set(), False, False
+        raise
+
+    names = set()
+    overflow = False
+    closed = False
+    offset = 0
+    while offset + _EVENT_HEADER.size <= len(data):
+        _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+        start = offset + _EVENT_HEADER.size
+        name = os.fsdecode(data[start:start + length].rstrip(b"\0"))
+        offset = start + length
+
+        if mask & IN_Q_OVERFLOW:
+            overflow = True
+        elif mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+            closed = True
+        elif _is_skin(name):
+            names.add(name)
+    return names, overflow, closed
+
+
+def _pack_is_current(minecraft_dir: str, skin_name: str, skin_path: str) -> bool:
+    pack_name = _existing_pack(minecraft_dir, skin_name)
+    if not pack_name:
+        return False
+    try:
+        return os.stat(os.path.join(minecraft_dir, "resourcepacks", pack_name)).st_mtime_ns >= os.stat(skin_path).st_mtime_ns
+    except OSError:
+        return False
+
+
+def _flush(pending: set, known: dict, minecraft_dir: str, min_skin_dir: str, summary: dict):
+    current = {name: _stat_signature(os.path.join(min_skin_dir, name)) for name in pending}
+    removed = [name for name in sorted(pending) if current[name] is None and name in known]
+    changed = [name for name in sorted(pending) if current[name] and current[name] != known.get(name)]
+    if not removed and not changed:
+        return
+
+    new_by_inode = {current[name][0]: name for name in changed if name not in known}
+    for name in list(removed):
+        new_name = new_by_inode.pop(known[name][0], None)
+        if not new_name or known[name][1:] != current[new_name][1:]:
+            continue
+        old_pack = _existing_pack(minecraft_dir, _sanitize_name(name))
+        new_skin_name = _sanitize_name(new_name)
+        if old_pack and not _existing_pack(minecraft_dir, new_skin_name):
+            try:
+                new_pack = _rename_skin_pack(minecraft_dir, min_skin_dir, old_pack, new_skin_name)
+                print(f"Renamed skin pack '{old_pack}' to '{new_pack}'.")
+                summary["renamed"].append([old_pack, new_pack])
+                changed.remove(new_name)
+                removed.remove(name)
+            except Exception as e:
+                print(f"Failed to rename skin pack '{old_pack}': {e}")
+
+    for name in removed:
+        pack_name = _existing_pack(minecraft_dir, _sanitize_name(name))
+        if not pack_name:
+            continue
+        try:
+            _delete_skin_pack(minecraft_dir, min_skin_dir, pack_name)
+            print(f"Removed skin pack '{pack_name}'.")
+            summary["removed"].append(pack_name)
+        except Exception as e:
+            print(f"Failed to remove skin pack '{pack_name}': {e}")
+
+    paths = [
+        os.path.join(min_skin_dir, name) for name in changed
+        if not _pack_is_current(minecraft_dir, _sanitize_name(name), os.path.join(min_skin_dir, name))
+    ]
+    if paths:
+        normalized, invalid, _ = _normalize_into_library([(path, path) for path in paths], min_skin_dir)
+        summary["invalid"].extend(item["path"] for item in invalid)
+
+        overwrite_flag = {"yes_all": True, "no_prompt": True}
+        jobs = []
+        for path in normalized:
+            skin_name = _sanitize_name(os.path.basename(path))
+            resourcepack_dir = _resolve_skin_pack(path, minecraft_dir, overwrite_flag, skin_name=skin_name)
+            if resourcepack_dir:
+                jobs.append((path, resourcepack_dir))
+
+        built = [os.path.basename(d) for d in _build_skin_packs(jobs, failed=summary["failed"])]
+        if built:
+            print(f"Built {len(built)} skin pack(s).")
+        summary["built"].extend(built)
+
+    for name in pending:
+        signature = _stat_signature(os.path.join(min_skin_dir, name))
+        if signature:
+            known[name] = signature
+        else:
+            known.pop(name, None)
+    summary["batches"] += 1
+
+
+def watch_skins(minecraft_dir: str = None, min_skin_dir: str = None, debounce: float = DEBOUNCE_SECONDS,
+                poll: bool = False, poll_interval: float = POLL_INTERVAL) -> dict:
+    minecraft_dir = minecraft_dir or get_minecraft_dir()
+    min_skin_dir = os.path.abspath(min_skin_dir or "min_skin")
+    os.makedirs(min_skin_dir, exist_ok=True)
+    os.makedirs(os.path.join(minecraft_dir, "resourcepacks"), exist_ok=True)
+
+    known = _snapshot(min_skin_dir)
+    seen = dict(known)
+    pending = {name for name in known if not _existing_pack(minecraft_dir, _sanitize_name(name))}
+    for name in pending:
+        known.pop(name)
+
+    fd = None if poll else _inotify_open(min_skin_dir)
+    summary = {"backend": "inotify" if fd is not None else "polling", "batches": 0, "built": [], "renamed": [], "removed": [], "invalid": [], "failed": []}
+    print(f"Watching {min_skin_dir} for skin changes ({summary['backend']}). Press Ctrl+C to stop.")
+
+    first_event = last_event = time.monotonic() if pending else None
+    try:
+        while True:
+            now = time.monotonic()
+            if pending and (now - last_event >= debounce or now - first_event >= MAX_BATCH_DELAY):
+                _flush(pending, known, minecraft_dir, min_skin_dir, summary)
+                pending = set()
+                continue
+
+            if fd is not None:
+                timeout = max(0.0, debounce - (now - last_event)) if pending else None
+                changed, overflow, closed = _read_events(fd, timeout)
+                if overflow:
+                    changed |= _diff(_snapshot(min_skin_dir), known)
+                if closed:
+                    print(f"{min_skin_dir} was removed; stopping watch.")
+                    break
+            else:
+                time.sleep(poll_interval)
+                current = _snapshot(min_skin_dir)
+                changed = _diff(current, seen)
+                seen = current
+
+            if changed:
+                now = time.monotonic()
+                if not pending:
+                    first_event = now
+                last_event = now
+                pending |= changed
+    except KeyboardInterrupt:
+        print("\nStopped watching skins.")
+    finally:
+        if fd is not None:
+            os.close(fd)
+    return summary
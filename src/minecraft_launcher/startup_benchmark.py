@@ -0,0 +1,106 @@
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+ENTRY_MODULE = "minecraft_launcher.__main__"
+HEAVY_MODULES = ("minecraft_launcher_lib", "questionary", "prompt_toolkit", "tqdm", "PIL", "tkinter", "requests", "numpy")
+DEFAULT_BUDGET_MS = 150
+DEFAULT_RUNS = 5
+DEFAULT_TOP = 15
+
+
+def run_importtime(module: str = ENTRY_MODULE):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr else "import failed")
+    return completed.stderr, wall_ms
+
+
+def parse_importtime(output: str) -> list:
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        except ValueError:
+            continue
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        entries.append({
+            "module": name.strip(),
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+            "depth": depth,
+        })
+    return entries
+
+
+def build_report(entries: list, wall_ms: float, top: int = DEFAULT_TOP) -> dict:
+    total_us = sum(e["cumulative_us"] for e in entries if e["depth"] == 0)
+    names = {e["module"] for e in entries}
+    heavy = sorted(
+        m for m in HEAVY_MODULES
+        if any(n == m or n.startswith(f"{m}.") for n in names)
+    )
+    slowest = sorted(entries, key=lambda e: e["cumulative_us"], reverse=True)[:top]
+    return {
+        "import_ms": total_us / 1000,
+        "wall_ms": wall_ms,
+        "module_count": len(entries),
+        "heavy_modules": heavy,
+        "slowest": slowest,
+    }
+
+
+def print_report(report: dict, budget_ms: float):
+    print("\n[Startup Benchmark]")
+    print(f" - Interpreter + imports (wall): {report['wall_ms']:.1f} ms (budget {budget_ms:.0f} ms)")
+    print(f" - Import time: {report['import_ms']:.1f} ms across {report['module_count']} modules")
+    print(f" - Heavy modules loaded: {', '.join(report['heavy_modules']) or 'none'}")
+    print("\n   cumulative ms   self ms   module")
+    for entry in report["slowest"]:
+        print(f"   {entry['cumulative_us'] / 1000:13.1f} {entry['self_us'] / 1000:9.1f}   "
+              f"{'  ' * entry['depth']}{entry['module']}")
+    print()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the import cost of the launcher entry point.")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP)
+    parser.add_argument("--module", default=ENTRY_MODULE)
+    args = parser.parse_args(argv)
+
+    best = None
+    for _ in range(max(1, args.runs)):
+        output, wall_ms = run_importtime(args.module)
+        report = build_report(parse_importtime(output), wall_ms, args.top)
+        if best is None or report["wall_ms"] < best["wall_ms"]:
+            best = report
+
+    print_report(best, args.budget_ms)
+
+    if best["heavy_modules"]:
+        print("FAIL: heavy modules are imported at startup.")
+        return 1
+    if best["wall_ms"] > args.budget_ms:
+        print("FAIL: startup exceeds the time budget.")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,63 @@
 import os
 import json
+import zipfile
+from .config_store import CACHE_DIR, load_config, edit_config
+from .pack_format_resolver import resolve_pack_format
+
+PACK_STATE_FILE = os.path.join(CACHE_DIR, "pack_format_state.json")
+
+
+def _read_mcmeta(pack_path: str):
+    if pack_path.endswith(".zip"):
+        if not os.path.isfile(pack_path):
+            return None
+        with zipfile.ZipFile(pack_path) as archive:
+            if "pack.mcmeta" not in archive.namelist():
+                return None
+            return json.loads(archive.read("pack.mcmeta").decode("utf-8"))
+
+    mcmeta_path = os.path.join(pack_path, "pack.mcmeta")
+    if not os.path.exists(mcmeta_path):
+        return None
+    with open(mcmeta_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_mcmeta(pack_path: str, data: dict):
+    if not pack_path.endswith(".zip"):
+        mcmeta_path = os.path.join(pack_path, "pack.mcmeta")
+        tmp_path = f"{mcmeta_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, mcmeta_path)
+        return
+
+    tmp_path = f"{pack_path}.{os.getpid()}.tmp"
+    with zipfile.ZipFile(pack_path) as src, zipfile.ZipFile(tmp_path, "w") as dst:
+        for item in src.infolist():
+            if item.filename != "pack.mcmeta":
+                dst.writestr(item, src.read(item))
+        dst.writestr("pack.mcmeta", json.dumps(data, indent=2), zipfile.ZIP_DEFLATED)
+    os.replace(tmp_path, pack_path)
+
+
+def _pack_signature(pack_path: str):
+    stat_path = pack_path if pack_path.endswith(".zip") else os.path.join(pack_path, "pack.mcmeta")
+    try:
+        st = os.stat(stat_path)
+        return [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return None
+
+
+def _apply_pack_format(data: dict, pack_format: int) -> dict:
+    pack_data = dict(data.get("pack", {}))
+    pack_data["pack_format"] = pack_format
+    pack_data["min_format"] = [1, 0]
+    pack_data["max_format"] = [pack_format, 0]
+    pack_data["supported_formats"] = [1, pack_format]
+    return dict(data, pack=pack_data)
+
 
 def update_skin_pack_formats(minecraft_dir, current_version, pack_format_map_path, launcher_config_path):
     print("\n[Resource Pack Updater] Checking skin packs...")
@@ -11,68 +69,60 @@ def update_skin_pack_formats(minecraft_dir, current_version, pack_format_map_pat
         return
 
     try:
-        with open(pack_format_map_path, "r", encoding="utf-8") as f:
-            version_to_pack = json.load(f)
+        pack_format, exact = resolve_pack_format(current_version, pack_format_map_path)
     except Exception as e:
         print(f"Failed to read resourcepack_pack_format.json: {e}")
         return
 
-    pack_format = version_to_pack.get(current_version)
-    if pack_format is None:
+    if not exact:
         print(f"No exact pack_format found for version {current_version}.")
-        try:
-            numeric_formats = [float(v) for v in version_to_pack.values() if isinstance(v, (int, float, str))]
-            pack_format = int(max(numeric_formats))
-            print(f"Using latest known pack_format: {pack_format}")
-        except Exception:
-            pack_format = 18
-
-    tracked_packs = []
-    if os.path.exists(launcher_config_path):
-        try:
-            with open(launcher_config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                tracked_packs = data.get("custom_skins", [])
-        except Exception as e:
-            print(f"Could not read launcher_config.json: {e}")
+        print(f"Using nearest known pack_format: {pack_format}")
+
+    tracked_packs = load_config(launcher_config_path).get("custom_skins", [])
 
     if not tracked_packs:
         print("No tracked custom skins found in launcher_config.json.")
         return
 
+    pack_state = load_config(PACK_STATE_FILE)
+    state_changes = {}
+
     updated_count = 0
     for pack_name in tracked_packs:
-        pack_dir = os.path.join(resourcepacks_dir, pack_name)
-        mcmeta_path = os.path.join(pack_dir, "pack.mcmeta")
+        pack_path = os.path.join(resourcepacks_dir, pack_name)
+        state_key = os.path.abspath(pack_path)
 
-        if not os.path.exists(mcmeta_path):
+        signature = _pack_signature(pack_path)
+        if signature is None:
             continue
 
-        try:
-            with open(mcmeta_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            pack_data = data.get("pack", {})
-            old_pack_format = pack_data.get("pack_format")
-
-            if old_pack_format != pack_format:
-                pack_data["pack_format"] = pack_format
+        known = pack_state.get(state_key)
+        if known and known.get("format") == pack_format and known.get("signature") == signature:
+            continue
 
-            pack_data["min_format"] = [1, 0]
-            pack_data["max_format"] = [pack_format, 0]
-            pack_data["supported_formats"] = [1, pack_format]
+        try:
+            data = _read_mcmeta(pack_path)
+            if data is None:
+                continue
 
-            data["pack"] = pack_data
+            old_pack_format = data.get("pack", {}).get("pack_format")
+            new_data = _apply_pack_format(data, pack_format)
 
-            with open(mcmeta_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            if new_data != data:
+                _write_mcmeta(pack_path, new_data)
+                signature = _pack_signature(pack_path)
+                print(f"Updated '{pack_name}' pack.mcmeta: {old_pack_format} → {pack_format}, formats added.")
+                updated_count += 1
 
-            print(f"Updated '{pack_name}' pack.mcmeta: {old_pack_format} → {pack_format}, formats added.")
-            updated_count += 1
+            state_changes[state_key] = {"format": pack_format, "signature": signature}
 
         except Exception as e:
             print(f"Failed to update {pack_name}: {e}")
 
+    if state_changes:
+        with edit_config(PACK_STATE_FILE) as state:
+            state.update(state_changes)
+
     if updated_count == 0:
         print("All tracked skin packs are already up to date.")
     else:
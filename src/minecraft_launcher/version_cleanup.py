@@ -0,0 +1,240 @@
+import os
+import json
+import time
+import shutil
+import threading
+from .downloader import _maven_path
+
+TRASH_DIR_NAME = ".trash"
+PROTECTED_LIBRARY_PREFIXES = (
+    "net/minecraftforge/",
+    "net/neoforged/",
+    "cpw/mods/",
+    "de/oceanlabs/",
+    "net/minecraft/client/",
+    "net/minecraft/server/",
+)
+
+_reclaimers = []
+
+
+def trash_dir(minecraft_dir: str) -> str:
+    return os.path.join(minecraft_dir, TRASH_DIR_NAME)
+
+
+def _tree_size(root: str) -> dict:
+    result = {"files": 0, "bytes": 0, "reclaimable": 0}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            try:
+                st = os.lstat(os.path.join(dirpath, filename))
+            except OSError:
+                continue
+            result["files"] += 1
+            result["bytes"] += st.st_size
+            if st.st_nlink <= 1:
+                result["reclaimable"] += st.st_size
+    return result
+
+
+def _reclaim(path: str):
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _start_reclaim(paths: list) -> threading.Thread:
+    thread = threading.Thread(target=lambda: [_reclaim(p) for p in paths])
+    thread.start()
+    _reclaimers.append(thread)
+    return thread
+
+
+def purge_trash(minecraft_dir: str, background: bool = True):
+    trash = trash_dir(minecraft_dir)
+    if not os.path.isdir(trash):
+        return None
+
+    leftovers = [os.path.join(trash, name) for name in os.listdir(trash)]
+    if not leftovers:
+        return None
+    if background:
+        return _start_reclaim(leftovers)
+    for path in leftovers:
+        _reclaim(path)
+    return None
+
+
+def wait_for_reclaim(timeout: float = None):
+    for thread in list(_reclaimers):
+        thread.join(timeout)
+        if not thread.is_alive():
+            _reclaimers.remove(thread)
+
+
+def _installed_version_data(minecraft_dir: str):
+    versions_dir = os.path.join(minecraft_dir, "versions")
+    for version_id in os.listdir(versions_dir) if os.path.isdir(versions_dir) else []:
+        json_path = os.path.join(versions_dir, version_id, f"{version_id}.json")
+        if not os.path.isfile(json_path):
+            continue
+        with open(json_path, "r", encoding="utf-8") as f:
+            yield version_id, json.load(f)
+
+
+def find_dependents(minecraft_dir: str, version_id: str) -> list:
+    return sorted(
+        other_id for other_id, version_data in _installed_version_data(minecraft_dir)
+        if version_data.get("inheritsFrom") == version_id and other_id != version_id
+    )
+
+
+def delete_version_tree(minecraft_dir: str, version_id: str, force: bool = False) -> dict:
+    version_path = os.path.join(minecraft_dir, "versions", version_id)
+    if not os.path.isdir(version_path):
+        raise FileNotFoundError(f"Version directory not found: {version_path}")
+
+    dependents = find_dependents(minecraft_dir, version_id)
+    if dependents and not force:
+        raise ValueError(f"'{version_id}' is required by installed version(s): {', '.join(dependents)}")
+
+    purge_trash(minecraft_dir)
+
+    result = _tree_size(version_path)
+    trash = trash_dir(minecraft_dir)
+    os.makedirs(trash, exist_ok=True)
+    target = os.path.join(trash, f"{version_id}.{int(time.time())}.{os.getpid()}")
+
+    try:
+        os.rename(version_path, target)
+    except OSError:
+        _reclaim(version_path)
+        if os.path.exists(version_path):
+            raise
+        return result
+
+    _start_reclaim([target])
+    return result
+
+
+def _library_references(version_data: dict) -> set:
+    paths = set()
+    for library in version_data.get("libraries", []):
+        if "name" in library:
+            try:
+                paths.add(_maven_path(library["name"]))
+            except IndexError:
+                pass
+
+        downloads = library.get("downloads") or {}
+        artifact = downloads.get("artifact")
+        if artifact and artifact.get("path"):
+            paths.add(artifact["path"])
+        for native in (downloads.get("classifiers") or {}).values():
+            if native.get("path"):
+                paths.add(native["path"])
+    return paths
+
+
+def collect_references(minecraft_dir: str) -> dict:
+    indexes_dir = os.path.join(minecraft_dir, "assets", "indexes")
+    references = {"libraries": set(), "indexes": set(), "objects": set(), "log_configs": set(), "missing_parents": set()}
+    installed = dict(_installed_version_data(minecraft_dir))
+
+    for version_data in installed.values():
+        if version_data.get("inheritsFrom") and version_data["inheritsFrom"] not in installed:
+            references["missing_parents"].add(version_data["inheritsFrom"])
+
+        references["libraries"].update(_library_references(version_data))
+
+        asset_index = version_data.get("assetIndex") or {}
+        if asset_index.get("id"):
+            references["indexes"].add(f"{asset_index['id']}.json")
+
+        logging_file = (version_data.get("logging") or {}).get("client", {}).get("file") or {}
+        if logging_file.get("id"):
+            references["log_configs"].add(logging_file["id"])
+
+    for index_name in references["indexes"]:
+        index_path = os.path.join(indexes_dir, index_name)
+        if not os.path.isfile(index_path):
+            continue
+        with open(index_path, "r", encoding="utf-8") as f:
+            objects = json.load(f).get("objects", {})
+        references["objects"].update(obj["hash"] for obj in objects.values())
+
+    return references
+
+
+def _walk_files(root: str):
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            yield path, os.path.relpath(path, root).replace(os.sep, "/")
+
+
+def find_orphans(minecraft_dir: str) -> list:
+    references = collect_references(minecraft_dir)
+    assets_dir = os.path.join(minecraft_dir, "assets")
+    orphans = []
+
+    if references["missing_parents"]:
+        print(f"Skipping cleanup: parent version(s) {', '.join(sorted(references['missing_parents']))} are not installed, "
+              f"so the libraries and assets they provide cannot be resolved.")
+        return orphans
+
+    for path, rel_path in _walk_files(os.path.join(minecraft_dir, "libraries")):
+        if rel_path in references["libraries"] or rel_path.startswith(PROTECTED_LIBRARY_PREFIXES):
+            continue
+        orphans.append(path)
+
+    for path, rel_path in _walk_files(os.path.join(assets_dir, "objects")):
+        if os.path.basename(path) not in references["objects"]:
+            orphans.append(path)
+
+    for path, rel_path in _walk_files(os.path.join(assets_dir, "indexes")):
+        if rel_path not in references["indexes"]:
+            orphans.append(path)
+
+    for path, rel_path in _walk_files(os.path.join(assets_dir, "log_configs")):
+        if rel_path not in references["log_configs"]:
+            orphans.append(path)
+
+    return orphans
+
+
+def _remove_empty_dirs(root: str):
+    for dirpath, _, _ in sorted(os.walk(root), key=lambda entry: len(entry[0]), reverse=True):
+        if dirpath != root:
+            try:
+                os.rmdir(dirpath)
+            except OSError:
+                pass
+
+
+def collect_garbage(minecraft_dir: str, dry_run: bool = False, store_dir: str = None) -> dict:
+    result = {"files": 0, "bytes": 0, "reclaimed": 0, "failed": 0, "store_files": 0}
+
+    for path in find_orphans(minecraft_dir):
+        try:
+            st = os.lstat(path)
+            if not dry_run:
+                os.remove(path)
+        except OSError:
+            result["failed"] += 1
+            continue
+        result["files"] += 1
+        result["bytes"] += st.st_size
+        if st.st_nlink <= 1:
+            result["reclaimed"] += st.st_size
+
+    if not dry_run:
+        _remove_empty_dirs(os.path.join(minecraft_dir, "libraries"))
+        _remove_empty_dirs(os.path.join(minecraft_dir, "assets", "objects"))
+
+    if store_dir:
+        from .asset_store import prune_store
+        pruned = prune_store(store_dir, dry_run=dry_run)
+        result["store_files"] = pruned["files"]
+        result["reclaimed"] += pruned["bytes"]
+        result["failed"] += pruned["failed"]
+
+    return result
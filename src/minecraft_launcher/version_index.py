@@ -0,0 +1,123 @@
+import os
+import json
+import time
+from .config_store import load_config, edit_config
+from .version_parser import detect_loader
+
+INDEX_FILE_NAME = "launcher_version_index.json"
+INDEX_FORMAT = 1
+
+
+def index_path(minecraft_dir: str) -> str:
+    return os.path.join(minecraft_dir, INDEX_FILE_NAME)
+
+
+def _versions_mtime(minecraft_dir: str):
+    try:
+        return os.stat(os.path.join(minecraft_dir, "versions")).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _json_path(minecraft_dir: str, version_id: str) -> str:
+    return os.path.join(minecraft_dir, "versions", version_id, f"{version_id}.json")
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            try:
+                total += os.lstat(os.path.join(root, file)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _read_entry(minecraft_dir: str, version_id: str, previous: dict = None):
+    json_path = _json_path(minecraft_dir, version_id)
+    try:
+        st = os.stat(json_path)
+    except OSError:
+        return None
+
+    signature = [st.st_mtime_ns, st.st_size]
+    if previous and previous.get("signature") == signature:
+        return previous
+
+    try:
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Failed to read version JSON for '{version_id}': {e}")
+        return None
+
+    inherits_from = data.get("inheritsFrom")
+    return {
+        "id": version_id,
+        "type": data.get("type", "release"),
+        "releaseTime": data.get("releaseTime"),
+        "inheritsFrom": inherits_from,
+        "loader": detect_loader(version_id, inherits_from),
+        "size": _dir_size(os.path.dirname(json_path)),
+        "last_played": previous.get("last_played") if previous else None,
+        "signature": signature,
+    }
+
+
+def _sync(index: dict, minecraft_dir: str, force: set = ()):
+    versions_dir = os.path.join(minecraft_dir, "versions")
+    entries = index.get("entries", {})
+    names = sorted(os.listdir(versions_dir)) if os.path.isdir(versions_dir) else []
+
+    synced = {}
+    for version_id in names:
+        previous = entries.get(version_id)
+        entry = _read_entry(minecraft_dir, version_id, None if version_id in force else previous)
+        if entry is not None:
+            if previous and entry is not previous:
+                entry["last_played"] = previous.get("last_played")
+            synced[version_id] = entry
+
+    index["format"] = INDEX_FORMAT
+    index["versions_mtime"] = _versions_mtime(minecraft_dir)
+    index["entries"] = synced
+
+
+def _public(entry: dict) -> dict:
+    return {k: v for k, v in entry.items() if k != "signature"}
+
+
+def get_installed_versions(minecraft_dir: str) -> list:
+    path = index_path(minecraft_dir)
+    index = load_config(path)
+
+    if index.get("format") == INDEX_FORMAT and index.get("versions_mtime") == _versions_mtime(minecraft_dir):
+        return [_public(e) for e in index.get("entries", {}).values()]
+
+    with edit_config(path) as index:
+        _sync(index, minecraft_dir)
+        entries = list(index["entries"].values())
+    return [_public(e) for e in entries]
+
+
+def refresh_version_index(minecraft_dir: str, version_id: str = None) -> list:
+    with edit_config(index_path(minecraft_dir)) as index:
+        _sync(index, minecraft_dir, force={version_id} if version_id else ())
+        entries = list(index["entries"].values())
+    return [_public(e) for e in entries]
+
+
+def forget_version(minecraft_dir: str, version_id: str):
+    with edit_config(index_path(minecraft_dir)) as index:
+        index.get("entries", {}).pop(version_id, None)
+        _sync(index, minecraft_dir)
+
+
+def mark_played(minecraft_dir: str, version_id: str):
+    with edit_config(index_path(minecraft_dir)) as index:
+        if index.get("versions_mtime") != _versions_mtime(minecraft_dir):
+            _sync(index, minecraft_dir)
+        entry = index.get("entries", {}).get(version_id)
+        if entry is not None:
+            entry["last_played"] = time.time()
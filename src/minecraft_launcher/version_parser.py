@@ -0,0 +1,60 @@
+import re
+from collections import namedtuple
+from .pack_format_resolver import strip_modloader, version_key
+
+ParsedVersion = namedtuple("ParsedVersion", ["id", "base", "kind", "loader", "sort_key"])
+
+_LOADER_PATTERNS = [
+    (re.compile(r"^fabric-loader-", re.IGNORECASE), "fabric"),
+    (re.compile(r"^quilt-loader-", re.IGNORECASE), "quilt"),
+    (re.compile(r"(?:^|-)neoforge-", re.IGNORECASE), "neoforge"),
+    (re.compile(r"(?:^|-)forge", re.IGNORECASE), "forge"),
+    (re.compile(r"-optifine", re.IGNORECASE), "optifine"),
+]
+_STAGE_KINDS = {0: "snapshot", 1: "pre-release", 2: "rc", 3: "release"}
+
+LOADER_LABELS = {
+    "forge": "Forge",
+    "neoforge": "NeoForge",
+    "fabric": "Fabric",
+    "quilt": "Quilt",
+    "optifine": "OptiFine",
+    "other": "Other modloaders",
+}
+
+_parsed = {}
+
+
+def detect_loader(version_id: str, inherits_from: str = None):
+    for pattern, loader in _LOADER_PATTERNS:
+        if pattern.search(version_id):
+            return loader
+    return "other" if inherits_from else None
+
+
+def _parse(version_id: str, inherits_from: str) -> ParsedVersion:
+    loader = detect_loader(version_id, inherits_from)
+    base = strip_modloader(version_id) if loader else version_id
+    if loader == "other" and inherits_from:
+        base = inherits_from
+
+    parsed = version_key(base)
+    if parsed is None:
+        return ParsedVersion(version_id, base, "unknown", loader, (0, (version_id.lower(),), version_id))
+
+    family, key = parsed
+    if family == "snapshot":
+        return ParsedVersion(version_id, base, "snapshot", loader, (1, key, version_id))
+    return ParsedVersion(version_id, base, _STAGE_KINDS[key[3]], loader, (2, key, version_id))
+
+
+def parse_version(version_id: str, inherits_from: str = None) -> ParsedVersion:
+    cache_key = (version_id, inherits_from)
+    parsed = _parsed.get(cache_key)
+    if parsed is None:
+        parsed = _parsed[cache_key] = _parse(version_id, inherits_from)
+    return parsed
+
+
+def sort_versions(parsed_versions, newest_first: bool = True) -> list:
+    return sorted(parsed_versions, key=lambda p: p.sort_key, reverse=newest_first)
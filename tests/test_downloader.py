@@ -0,0 +1,137 @@
+import os
+import sys
+import hashlib
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from minecraft_launcher.asset_store import store_path
+from minecraft_launcher.downloader import download_file, download_all
+
+PAYLOAD = bytes(range(256)) * 1024
+PAYLOAD_SHA1 = hashlib.sha1(PAYLOAD).hexdigest()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.headers.get("Range")))
+            corrupt = server.corrupt_next > 0
+            if corrupt:
+                server.corrupt_next -= 1
+
+        body = PAYLOAD
+        if corrupt:
+            body = b"\0" * len(PAYLOAD)
+
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and server.honor_range:
+            start = int(range_header.split("=", 1)[1].rstrip("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+        self.wfile.write(body[start:])
+
+    def log_message(self, *args):
+        pass
+
+
+class DownloaderTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.corrupt_next = 0
+        self.server.honor_range = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/blob"
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "game", "blob.bin")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def _task(self, path: str) -> dict:
+        return {"url": self.url, "path": path, "sha1": PAYLOAD_SHA1, "size": len(PAYLOAD)}
+
+    def test_resumes_partial_download_with_range(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path + ".part", "wb") as f:
+            f.write(PAYLOAD[:1000])
+
+        written = download_file(self.url, self.path, PAYLOAD_SHA1, len(PAYLOAD))
+
+        self.assertEqual(written, len(PAYLOAD) - 1000)
+        self.assertEqual(self.server.requests, [("/blob", "bytes=1000-")])
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), PAYLOAD)
+        self.assertFalse(os.path.exists(self.path + ".part"))
+
+    def test_restarts_when_server_ignores_range(self):
+        self.server.honor_range = False
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path + ".part", "wb") as f:
+            f.write(PAYLOAD[:1000])
+
+        written = download_file(self.url, self.path, PAYLOAD_SHA1, len(PAYLOAD))
+
+        self.assertEqual(written, len(PAYLOAD))
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), PAYLOAD)
+
+    def test_sha1_mismatch_is_retried(self):
+        self.server.corrupt_next = 1
+
+        with self.assertRaises(ValueError):
+            download_file(self.url, self.path, PAYLOAD_SHA1, len(PAYLOAD))
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(self.path + ".part"))
+
+        self.server.corrupt_next = 1
+        result = download_all([self._task(self.path)], max_workers=1, retries=1)
+
+        self.assertEqual(result["downloaded"], 1)
+        self.assertEqual(result["failed"], [])
+        self.assertEqual(len(self.server.requests), 3)
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), PAYLOAD)
+
+    def test_sha1_mismatch_fails_after_retries(self):
+        self.server.corrupt_next = 2
+
+        result = download_all([self._task(self.path)], max_workers=1, retries=1)
+
+        self.assertEqual(result["downloaded"], 0)
+        self.assertEqual(len(result["failed"]), 1)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_links_from_shared_store(self):
+        store_dir = os.path.join(self.tmp.name, "store")
+        other_path = os.path.join(self.tmp.name, "other", "blob.bin")
+
+        first = download_all([self._task(self.path)], max_workers=1, store_dir=store_dir)
+        self.assertEqual(first["downloaded"], 1)
+        self.assertTrue(os.path.isfile(store_path(store_dir, PAYLOAD_SHA1)))
+
+        second = download_all([self._task(other_path)], max_workers=1, store_dir=store_dir)
+        self.assertEqual(second["linked"], 1)
+        self.assertEqual(second["downloaded"], 0)
+        self.assertEqual(len(self.server.requests), 1)
+        with open(other_path, "rb") as f:
+            self.assertEqual(f.read(), PAYLOAD)
+
+
+if __name__ == "__main__":
+    unittest.main()